@@ -1,11 +1,45 @@
 from ursina import *
 from ursina.shaders import unlit_shader, lit_with_shadows_shader, matcap_shader, triplanar_shader, normals_shader
+from ursina.prefabs.vec_field import VecField
+from ursina import shaders as ursina_shaders
 from time import perf_counter
+from panda3d.core import ClockObject
 import csv
+import os
+import sys
+import weakref
+from functools import partial, lru_cache
 import builtins
 import pyperclip
 import inspect
 
+
+# (prefix, message, exception type) of the errors already reported by _report_update_error
+_REPORTED_UPDATE_ERRORS = set()
+
+
+def _report_update_error(prefix, message, error):
+    """
+    Log an exception caught in a per-frame `update` method.
+
+    An error that keeps happening every frame would otherwise print (and format) a line per frame, flooding stdout
+    and eating into the frame time. Each distinct error is printed the first time it happens; repeats are only
+    printed while LEVEL_EDITOR.debug is True.
+
+    Args:
+        prefix (str): The log prefix, e.g. '[Duplicator]'.
+        message (str): What failed, e.g. 'Error in update()'.
+        error (Exception): The caught exception.
+    """
+    key = (prefix, message, type(error))
+    if key in _REPORTED_UPDATE_ERRORS:
+        if not getattr(getattr(builtins, 'LEVEL_EDITOR', None), 'debug', False):
+            return
+    else:
+        _REPORTED_UPDATE_ERRORS.add(key)
+    print(f"{prefix} {message}: {error}")
+
+
 class LevelEditor(Entity):
     """
     LevelEditor is a comprehensive tool for managing, editing, and visualizing game scenes within a grid-based layout.
@@ -19,6 +53,7 @@ class LevelEditor(Entity):
         """
         super().__init__()
         builtins.LEVEL_EDITOR = self  # Register the global editor instance (type: ignore due to dynamic global use)
+        self.debug = False  # Print extra diagnostic output (e.g. the recipes of duplicated entities)
 
         # Scene and grid setup
         self.scene_folder = application.asset_folder / 'scenes'
@@ -161,10 +196,9 @@ class LevelEditor(Entity):
         self.help._base_ui_scale = (8 / h) * 2  # 25px diameter, adjust as needed
         self.help.scale = self.help._base_ui_scale
 
-        # For the tooltip
-        self.help.tooltip._init_w, self.help.tooltip._init_h = window.size
-        self.help.tooltip._base_ui_scale = (12 / h) * 2  # 50px text height, adjust as needed
-        self.help.tooltip.scale = self.help.tooltip._base_ui_scale
+        # For the tooltip, which Help only creates when it's first hovered
+        self.help._tooltip_init_w, self.help._tooltip_init_h = window.size
+        self.help._tooltip_base_ui_scale = (12 / h) * 2  # 50px text height, adjust as needed
 
         self._edit_mode = True
 
@@ -219,6 +253,16 @@ class LevelEditor(Entity):
             self.current_scene.selection = value
 
 
+    def get_entity_indices(self):
+        """
+        Build a mapping from id(entity) to its index in the current scene's entities.
+
+        Lets callers look up the index of many entities (e.g. for undo records) in one pass,
+        instead of calling entities.index(e) for each of them.
+        """
+        return {id(e): i for i, e in enumerate(self.entities)}
+
+
     def on_enable(self):
         """
         Called when the LevelEditor is enabled. Adjusts camera FOV and enables UI.
@@ -258,9 +302,10 @@ class LevelEditor(Entity):
         ratio = cur_w / (self.help._init_w or cur_w)
         self.help.scale = max(0.05, self.help._base_ui_scale * ratio)
         
-        # Dynamic scaling for tooltip
-        ratio_tooltip = cur_w / (self.help.tooltip._init_w or cur_w)
-        self.help.tooltip.scale = max(0.7, self.help.tooltip._base_ui_scale * ratio_tooltip)
+        # Dynamic scaling for tooltip (once it exists)
+        if self.help.tooltip is not None:
+            ratio_tooltip = cur_w / (self.help.tooltip._init_w or cur_w)
+            self.help.tooltip.scale = max(0.7, self.help.tooltip._base_ui_scale * ratio_tooltip)
 
         # Dynamic scaling for right-click menu
         ratio = cur_w / (self.right_click_menu.radial_menu._init_w or cur_w)
@@ -704,7 +749,8 @@ class Undo(Entity):
                 for e in target_entities:
                     if e in LEVEL_EDITOR.entities:  # type: ignore
                         LEVEL_EDITOR.entities.remove(e)  # type: ignore
-                    destroy(e)
+                    # Clones made by the Duplicator are kept for reuse by a later duplication; anything else is destroyed
+                    LEVEL_EDITOR.duplicator.recycle(e)  # type: ignore
 
             else:
                 # Revert attribute changes (generic)
@@ -1659,7 +1705,7 @@ class QuickGrabber(Entity):
                 ])
 
         except Exception as e:
-            print(f"[QuickGrabber] Error in update(): {e}")
+            _report_update_error('[QuickGrabber]', 'Error in update()', e)
 
 
 class QuickScaler(Entity):
@@ -1775,7 +1821,7 @@ class QuickScaler(Entity):
                     LEVEL_EDITOR.render_selection(update_gizmo_position=False)  # type: ignore
                     return
         except Exception as e:
-            print(f"[QuickScaler] Error in update loop: {e}")
+            _report_update_error('[QuickScaler]', 'Error in update loop', e)
 
 
 class QuickRotator(Entity):
@@ -1845,7 +1891,7 @@ class QuickRotator(Entity):
                 # Update gizmo position only if the mouse is moving while rotating
                 LEVEL_EDITOR.render_selection(update_gizmo_position=False)  # type: ignore
         except Exception as e:
-            print(f"[QuickRotator] Error in update: {e}")
+            _report_update_error('[QuickRotator]', 'Error in update', e)
 
 
 class RotateRelativeToView(Entity):
@@ -1946,7 +1992,7 @@ class RotateRelativeToView(Entity):
                 __class__._rotation_helper.rotation_y -= mouse.velocity[0] * __class__.sensitivity.x / camera.aspect_ratio
                 __class__._rotation_helper.rotation_x += mouse.velocity[1] * __class__.sensitivity.y
             except Exception as e:
-                print(f"[RotateRelativeToView] Error during update: {e}")
+                _report_update_error('[RotateRelativeToView]', 'Error during update', e)
 
 
 class Selector(Entity):
@@ -2173,7 +2219,7 @@ class SelectionBox(Entity):
             # --------------------------------------------
 
         except Exception as e:
-            print(f"[SelectionBox.update] Error during update: {e}")
+            _report_update_error('[SelectionBox.update]', 'Error during update', e)
 
 
 class WhiteCube(Entity):
@@ -2767,7 +2813,7 @@ class PointOfViewSelector(Entity):
         try:
             self.rotation = -LEVEL_EDITOR.editor_camera.rotation  # type: ignore
         except Exception as e:
-            print(f"[PointOfViewSelector.update] Error while updating rotation: {e}")
+            _report_update_error('[PointOfViewSelector.update]', 'Error while updating rotation', e)
 
     def input(self, key):
         """
@@ -3364,6 +3410,100 @@ class ColorField(InspectorButton):
             print(f"Error in on_click handler for ColorField: {e}")
 
 
+# Sentinels returned by _unique_or_mixed
+_MISSING = object()
+_MIXED = object()
+
+
+def _unique_or_mixed(entities, name):
+    """
+    Return the value of attribute `name` shared by all `entities` that have it.
+
+    Returns _MISSING if none of them has the attribute and _MIXED as soon as two different values are seen,
+    without looking at the remaining entities.
+    """
+    first = _MISSING
+    for e in entities:
+        value = getattr(e, name, _MISSING)
+        if value is _MISSING:
+            continue
+        if first is _MISSING:
+            first = value
+        elif value is not first and value != first:
+            return _MIXED
+    return first
+
+
+# Widget kind for the most common exact shader input value types
+_SHADER_INPUT_KINDS = {str: 'str', Vec2: 'vec2', Color: 'color'}
+
+
+def _get_shader_input_kind(value):
+    """
+    Return which inspector widget kind ('str', 'vec2' or 'color') should display a shader input value,
+    or None if it isn't editable from the inspector.
+
+    Exact types are resolved with a single dict lookup; subclasses and other 2-element sequences
+    fall back to the isinstance/len checks.
+    """
+    kind = _SHADER_INPUT_KINDS.get(type(value))
+    if kind is not None:
+        return kind
+
+    if isinstance(value, str):
+        return 'str'
+    # Look __len__ up on the class, so objects without it don't raise and catch an AttributeError
+    if isinstance(value, Vec2) or (getattr(type(value), '__len__', None) is not None and len(value) == 2):
+        return 'vec2'
+    if isinstance(value, Color):
+        return 'color'
+    return None
+
+
+# Shader -> its default inputs minus the ones the inspector doesn't show. Weak keys, so shaders can still be freed.
+_SHADER_INPUTS_CACHE = weakref.WeakKeyDictionary()
+
+
+def _get_editable_shader_inputs(shader):
+    """
+    Return `shader.default_input` without 'shadow_color', cached per shader so the filtered dict
+    isn't rebuilt on every inspector refresh.
+    """
+    try:
+        shader_inputs = _SHADER_INPUTS_CACHE.get(shader)
+    except TypeError:
+        # Shader can't be weakly referenced, don't cache it
+        return {key: value for key, value in shader.default_input.items() if key != 'shadow_color'}
+
+    if shader_inputs is None:
+        shader_inputs = {key: value for key, value in shader.default_input.items() if key != 'shadow_color'}
+        _SHADER_INPUTS_CACHE[shader] = shader_inputs
+    return shader_inputs
+
+
+# Shared callbacks for the fields generated by Inspector.update_inspector. They're bound per field with
+# functools.partial instead of defining a fresh closure for every field on every refresh.
+def _apply_attr_to_selection(name, field):
+    """Set attribute `name` to the field's value on every selected entity."""
+    for e in LEVEL_EDITOR.selection:  # type: ignore
+        setattr(e, name, field.value)
+
+
+def _apply_shader_input_to_selection(name, field):
+    """Set shader input `name` to the field's value on every selected entity."""
+    for e in LEVEL_EDITOR.selection:  # type: ignore
+        e.set_shader_input(name, field.value)
+
+
+def _toggle_attr_on_selection(inspector, name):
+    """Flip boolean attribute `name` (based on the inspected entity) on every selected entity and regenerate them."""
+    new_value = not getattr(inspector.selected_entity, name)
+    for e in LEVEL_EDITOR.selection:  # type: ignore
+        setattr(e, name, new_value)
+        if hasattr(e, 'generate'):
+            e.generate()
+
+
 class Inspector(Entity):
     """
     Inspector UI for editing properties of selected entities in the level editor.
@@ -3472,11 +3612,17 @@ class Inspector(Entity):
                         # Confirm it's indeed a float
                         if isinstance(value, float):
                             # Truncate the displayed text to 8 characters
-                            field.text_field.text_entity.text = str(value)[:8]
-                            # Apply this transform to all selected entities
+                            text = str(value)[:8]
+                            field.text_field.text_entity.text = text
+                            # Parse the displayed value once, not once per selected entity
+                            new_value = float(text)
+                            attr_name = names[x]
+                            # Apply this transform to all selected entities. Entities that already have the value
+                            # are skipped, so large selections don't pay for no-op transform updates.
                             for e in LEVEL_EDITOR.selection:  # type: ignore
                                 try:
-                                    setattr(e, names[x], float(field.text_field.text_entity.text))
+                                    if getattr(e, attr_name) != new_value:
+                                        setattr(e, attr_name, new_value)
                                 except Exception:
                                     # If the attribute does not exist or cannot be set, ignore
                                     continue
@@ -3558,6 +3704,10 @@ class Inspector(Entity):
 
         # Container for shader-specific inputs, positioned below other fields
         self.shader_inputs_parent = Entity(parent=self.name_field, y=-9)
+        # Widgets in the shader/custom section are pooled by kind and reused between refreshes
+        # instead of being destroyed and recreated every time the inspector updates.
+        self._shader_widget_pool = {kind: [] for kind in ('str', 'vec2', 'color', 'divider', 'bool', 'num', 'class')}
+        self._active_shader_widgets = []
 
         # Scale factor for UI, can be adjusted as needed
         self.scale = .6
@@ -3648,23 +3798,17 @@ class Inspector(Entity):
         # Update additional property fields: model, texture, collider_type, shader
         for name in ('model', 'texture', 'collider_type', 'shader'):
             try:
-                # Collect unique values of this attribute among all selected entities
-                unique_field_values = tuple(
-                    set(
-                        getattr(e, name)
-                        for e in LEVEL_EDITOR.selection  # type: ignore
-                        if hasattr(e, name)
-                    )
-                )  # type: ignore
+                # Find the value shared by all selected entities, stopping as soon as two differ
+                field_value = _unique_or_mixed(LEVEL_EDITOR.selection, name)  # type: ignore
             except Exception:
                 # If selection is malformed or attribute access fails, show error text
-                unique_field_values = ()
+                field_value = _MISSING
 
-            if unique_field_values == ():
+            if field_value is _MISSING:
                 text = '*error*'
-            elif len(unique_field_values) == 1:
+            elif field_value is not _MIXED:
                 # All selected entities share the same value: display it
-                text = unique_field_values[0]
+                text = field_value
                 # If this value has a 'name' attribute (e.g., a Model or Texture object), use it
                 if hasattr(text, 'name'):
                     try:
@@ -3683,56 +3827,40 @@ class Inspector(Entity):
                 # Skip if the field is missing
                 continue
 
-        # Clear any existing shader-specific input fields
-        try:
-            for child in list(self.shader_inputs_parent.children):
-                destroy(child)
-        except Exception:
-            # If children list is inaccessible, ignore
-            pass
-
-        # Dynamically generate shader input
-        from ursina.prefabs.vec_field import VecField
+        # Return the shader-specific input fields from the last refresh to the widget pool
+        self._release_shader_widgets()
 
         i = 0
         if self.selected_entity.shader:
-            shader_inputs = {key: value for key, value in self.selected_entity.shader.default_input.items() if key != 'shadow_color'}
+            shader_inputs = _get_editable_shader_inputs(self.selected_entity.shader)
             for name, value in shader_inputs.items():
                 instance_value = self.selected_entity.get_shader_input(name)
                 if instance_value:
                     value = instance_value
 
                 # Handle different types of shader inputs (texture, vector, color, etc.)
-                if isinstance(value, str):  # Texture input
-                    b = InspectorButton(parent=self.shader_inputs_parent, text=f' {name}: {value}', highlight_color=color.black90, y=-i)
-                    b.text_entity.scale *= .6
+                kind = _get_shader_input_kind(value)
+                if kind == 'str':  # Texture input
+                    b = self._get_shader_widget('str', f' {name}: {value}', y=-i)
                     b.on_click = Sequence(
                         Func(setattr, LEVEL_EDITOR.menu_handler, 'state', 'texture_menu'),  # type: ignore
                         Func(setattr, LEVEL_EDITOR.texture_menu, 'target_attr', name)  # type: ignore
                     )
-                elif isinstance(value, Vec2) or (hasattr(value, '__len__') and len(value) == 2):  # Vector input
-                    field = VecField(default_value=instance_value, parent=self.shader_inputs_parent, model='quad', scale=(1, 1), x=.5, y=-i - .5, text=f'  {name}')
-                    for e in field.fields:
-                        e.text_field.scale *= .6
-                        e.text_field.text_entity.color = color.light_gray
-                    field.text_entity.scale *= .6 * .75
-                    field.text_entity.color = color.light_gray
-
-                    def on_submit(name=name, field=field):
-                        for e in LEVEL_EDITOR.selection:  # type: ignore
-                            e.set_shader_input(name, field.value)
-                    field.on_value_changed = on_submit
-
-                elif isinstance(value, Color):  # Color input
-                    color_field = ColorField(parent=self.shader_inputs_parent, text=f' {name}', y=-i, is_shader_input=True, attr_name=name, value=value)
-                    color_field.text_entity.scale *= .6
+                elif kind == 'vec2':  # Vector input
+                    field = self._get_shader_widget('vec2', f'  {name}', y=-i - .5, value=value)
+                    field.on_value_changed = partial(_apply_shader_input_to_selection, name, field)
+
+                elif kind == 'color':  # Color input
+                    color_field = self._get_shader_widget('color', f' {name}', y=-i)
+                    color_field.attr_name = name
+                    color_field.value = value
 
                 i += 1
 
         # Handle custom inspector fields from the selected entity
         i += 0
         if hasattr(self.selected_entity, 'draw_inspector'):
-            divider = Entity(parent=self.shader_inputs_parent, model='quad', collider='box', origin=(-.5, .5), scale=(1, .5), color=color.black90, y=-i)
+            self._get_shader_widget('divider', None, y=-i)
             i += 1
             # Custom fields provided by the entity
             for name, _type in self.selected_entity.draw_inspector().items():
@@ -3740,38 +3868,19 @@ class Inspector(Entity):
                     continue
                 attr = getattr(self.selected_entity, name)
                 if attr is False or attr is True:  # Boolean field
-                    b = InspectorButton(parent=self.shader_inputs_parent, text=f' {name}:', highlight_color=color.red, y=-i, origin=(-.5, 0))
-                    b.text_entity.scale *= .6
-                    def toggle_value(name=name):
-                        new_value = not getattr(self.selected_entity, name)
-                        for e in LEVEL_EDITOR.selection:  # type: ignore
-                            setattr(e, name, new_value)
-                            if hasattr(e, 'generate'):
-                                e.generate()
-
-                    b.on_click = toggle_value
+                    b = self._get_shader_widget('bool', f' {name}:', y=-i)
+                    b.on_click = partial(_toggle_attr_on_selection, self, name)
 
                 elif _type in (float, int):  # Numeric fields
-                    field = VecField(default_value=attr, parent=self.shader_inputs_parent, model='quad', scale=(1, 1), x=.5, y=-i, text=f'  {name}')
-                    for e in field.fields:
-                        e.text_field.scale *= .6
-                        e.text_field.text_entity.color = color.light_gray
-                    field.text_entity.scale *= .6 * .75
-                    field.text_entity.color = color.light_gray
-
-                    def on_submit(name=name, field=field):
-                        for e in LEVEL_EDITOR.selection:  # type: ignore
-                            setattr(e, name, field.value)
-
-                    field.on_value_changed = on_submit
+                    field = self._get_shader_widget('num', f'  {name}', y=-i, value=attr)
+                    field.on_value_changed = partial(_apply_attr_to_selection, name, field)
 
                 elif isinstance(_type, type):  # Custom class fields
                     text = attr
                     if hasattr(attr, 'name'):
                         text = attr.__name__
 
-                    b = InspectorButton(parent=self.shader_inputs_parent, text=f' {name}: {text}', y=-i, origin=(-.5, 0))
-                    b.text_entity.scale *= .6
+                    b = self._get_shader_widget('class', f' {name}: {text}', y=-i)
                     b.on_click = Func(setattr, LEVEL_EDITOR.menu_handler, 'state', 'class_menu')  # type: ignore
 
                 i += 1
@@ -3794,6 +3903,84 @@ class Inspector(Entity):
             for child in self.shader_inputs_parent.children:
                 child.scale = Vec2(.5, .04) * ratio  # adjust as needed
 
+    def _create_shader_widget(self, kind, text, value):
+        """
+        Create a new widget of the given kind for the shader input / custom inspector section.
+
+        Only the parts that stay the same between refreshes (model, colors, text scale) are set up here;
+        `_get_shader_widget` fills in the text, position and value every time the widget is handed out.
+
+        Args:
+            kind (str): One of 'str', 'vec2', 'color', 'divider', 'bool', 'num' or 'class'.
+            text (str or None): Initial label text.
+            value: Initial value for 'vec2' and 'num' fields, which decides how many components they get.
+        """
+        parent = self.shader_inputs_parent
+        if kind == 'divider':
+            return Entity(parent=parent, model='quad', collider='box', origin=(-.5, .5), scale=(1, .5), color=color.black90)
+
+        if kind in ('vec2', 'num'):
+            field = VecField(default_value=value, parent=parent, model='quad', scale=(1, 1), x=.5, text=text)
+            for e in field.fields:
+                e.text_field.scale *= .6
+                e.text_field.text_entity.color = color.light_gray
+            field.text_entity.scale *= .6 * .75
+            field.text_entity.color = color.light_gray
+            return field
+
+        if kind == 'color':
+            widget = ColorField(parent=parent, text=text, is_shader_input=True)
+        elif kind == 'str':
+            widget = InspectorButton(parent=parent, text=text, highlight_color=color.black90)
+        elif kind == 'bool':
+            widget = InspectorButton(parent=parent, text=text, highlight_color=color.red, origin=(-.5, 0))
+        else:  # 'class'
+            widget = InspectorButton(parent=parent, text=text, origin=(-.5, 0))
+
+        widget.text_entity.scale *= .6
+        return widget
+
+    def _get_shader_widget(self, kind, text, y, value=None):
+        """
+        Hand out a widget of the given kind, reusing a pooled one when available instead of creating a new one.
+
+        The widget is enabled, positioned at `y`, gets its label set to `text` and, for 'vec2'/'num' fields,
+        its value set to `value`. It's tracked as active so the next refresh returns it to the pool.
+        """
+        pool = self._shader_widget_pool[kind]
+        if pool:
+            widget = pool.pop()
+            widget.enabled = True
+            if text is not None:
+                widget.text_entity.text = text
+            if kind in ('vec2', 'num'):
+                # Detach the previous callback so updating the value doesn't write to the selection
+                widget.on_value_changed = None
+                widget.value = value
+        else:
+            widget = self._create_shader_widget(kind, text, value)
+
+        widget.y = y
+        self._active_shader_widgets.append((kind, widget))
+        return widget
+
+    def _release_shader_widgets(self):
+        """
+        Hide the widgets handed out during the previous refresh and return them to the pool.
+        """
+        for kind, widget in self._active_shader_widgets:
+            widget.enabled = False
+            self._shader_widget_pool[kind].append(widget)
+        self._active_shader_widgets.clear()
+
+
+# Modifier keys that suppress the single-key menu shortcuts
+_MODIFIER_KEYS = ('control', 'shift', 'alt')
+
+# The menu handler state in which no menu is open, and the key that closes menus, interned once
+_STATE_NONE = sys.intern('None')
+_KEY_ESCAPE = sys.intern('escape')
+
 
 class MenuHandler(Entity):
     """
@@ -3811,7 +3998,7 @@ class MenuHandler(Entity):
         - Defines `keybinds` to allow keyboard shortcuts to open specific menus, provided no modifier keys are held.
 
         Error handling:
-        - If a state name is missing from `states` when setting, a KeyError will be raised. A try-except block in the setter elegantly logs the error.
+        - If a state name is missing from `states` when setting, the setter logs the error and ignores the request.
         """
         super().__init__(parent=LEVEL_EDITOR)  # type: ignore
         self._state = None  # Current active state (menu name as a string)
@@ -3827,14 +4014,19 @@ class MenuHandler(Entity):
             'collider_menu': LEVEL_EDITOR.collider_menu,  # type: ignore
             'class_menu': LEVEL_EDITOR.class_menu       # type: ignore
         }
+        # Pre-filtered (name, menu) pairs, so switching state doesn't have to walk and truth-test the whole dict
+        self._state_items = [(key, e) for key, e in self.states.items() if e]
 
         # Keyboard shortcuts for quick menu toggling (only works if no modifier keys are held).
+        # Keys and values are interned so lookups and state comparisons can take the identity fast path.
         self.keybinds = {
-            'm': 'model_menu',
-            'v': 'texture_menu',
-            'n': 'shader_menu',
-            'b': 'color_menu',
-            'escape': 'None'
+            sys.intern(key): sys.intern(state) for key, state in {
+                'm': 'model_menu',
+                'v': 'texture_menu',
+                'n': 'shader_menu',
+                'b': 'color_menu',
+                'escape': 'None'
+            }.items()
         }
 
     @property
@@ -3862,9 +4054,8 @@ class MenuHandler(Entity):
         Error handling:
         - If `value` is not a key in `self.states`, logs an error message and does nothing.
         """
-        try:
-            target_state = self.states[value]
-        except KeyError:
+        target_state = self.states.get(value)
+        if target_state is None:
             # Log an error if an invalid state name is provided
             print(f"[MenuHandler] Invalid state '{value}' requested. No such state exists.")
             return
@@ -3877,12 +4068,11 @@ class MenuHandler(Entity):
             return
 
         # Otherwise, disable all menu Entities except the one corresponding to `value`
-        for key, e in self.states.items():
-            if e:  # Some states might map to None or be uninitialized
-                e.enabled = (key == value)
+        for key, e in self._state_items:
+            e.enabled = (key == value)
 
-        # Update the internal state name
-        self._state = value
+        # Update the internal state name (interned, so input() can compare by identity)
+        self._state = sys.intern(value)
 
     def input(self, key):
         """
@@ -3900,24 +4090,135 @@ class MenuHandler(Entity):
         - Catches any unexpected exceptions during state changes and logs them without breaking the application.
         """
         try:
+            key = sys.intern(key)
+            menu_open = self._state is not _STATE_NONE
+
             # If escape is pressed while a menu is open, close all menus.
-            if key == 'escape' and self.state != 'None':
-                self.state = 'None'
+            if key is _KEY_ESCAPE and menu_open:
+                self.state = _STATE_NONE
                 return
 
             # If any menu is active, ignore other inputs
-            if self.state != 'None':
+            if menu_open:
                 return
 
-            # Only open a menu via keybind if no modifier keys are held and there is a selection
-            if (not held_keys['control'] and not held_keys['shift'] and not held_keys['alt']
-                    and key in self.keybinds and LEVEL_EDITOR.selection):  # type: ignore
-                self.state = self.keybinds[key]
+            # Only open a menu via keybind if no modifier keys are held and there is a selection.
+            # The keybind lookup comes first, so most keystrokes never touch held_keys.
+            target_state = self.keybinds.get(key)
+            if (target_state is not None and not any(held_keys[m] for m in _MODIFIER_KEYS)
+                    and LEVEL_EDITOR.selection):  # type: ignore
+                self.state = target_state
         except Exception as e:
             # Log any unexpected errors during input handling for debugging
             print(f"[MenuHandler] Error processing input '{key}': {e}")
 
 
+# Cache of asset folder scans: (asset_folder, file_types) -> ({folder path: mtime}, list of file stems)
+_ASSET_CACHE = {}
+
+
+def find_asset_stems(file_types):
+    """
+    Return the stems of all files under application.asset_folder whose suffix is one of `file_types`.
+
+    The result is cached per (asset_folder, file_types) together with the modification times of every folder
+    the scan visited, and reused as long as none of them changed (a file added or removed anywhere in the tree
+    changes its folder's mtime). This way reopening the model/texture menus costs one stat per folder instead
+    of a recursive glob over the whole asset tree.
+
+    Args:
+        file_types (tuple[str]): File extensions to look for, including the dot (e.g. ('.png', '.jpg')).
+
+    Returns:
+        list[str]: The stems (filenames without extension) of the matching files. Treat as read-only,
+        the same list is handed out on every cache hit.
+    """
+    asset_folder = application.asset_folder
+    key = (str(asset_folder), file_types)
+
+    cached = _ASSET_CACHE.get(key)
+    if cached and _folder_mtimes_unchanged(cached[0]):
+        return cached[1]
+
+    folder_mtimes = {}
+    stems_by_ext = _scan_by_ext(asset_folder, file_types, folder_mtimes)
+    stems = [stem for file_type in file_types for stem in stems_by_ext[file_type]]
+
+    _ASSET_CACHE[key] = (folder_mtimes, stems)
+    return stems
+
+
+def _folder_mtimes_unchanged(folder_mtimes):
+    """Return True if every folder in `folder_mtimes` (path -> mtime) still exists with the same mtime."""
+    try:
+        return all(os.stat(path).st_mtime == mtime for path, mtime in folder_mtimes.items())
+    except OSError:
+        return False
+
+
+def _scan_by_ext(root, exts, folder_mtimes=None):
+    """
+    Walk `root` once and bucket the stems of the files found by extension.
+
+    Unlike one glob('**/*.ext') per extension, the tree is only traversed a single time.
+    Extensions are matched case-insensitively (so '.PNG' counts as '.png', as the glob did on Windows),
+    and a file named just like an extension (e.g. '.png') keeps its whole name as the stem, like Path.stem.
+
+    Args:
+        root (Path or str): Folder to walk recursively. Symlinked folders aren't followed.
+        exts (tuple[str]): Extensions to collect, including the dot.
+        folder_mtimes (dict, optional): If given, filled with the modification time of every folder scanned,
+            keyed by path, so the caller can tell later whether the scan is still current.
+
+    Returns:
+        dict[str, list[str]]: For each extension, the stems of the matching files.
+
+    Error handling:
+    - A folder that can't be read (e.g. PermissionError) is logged and skipped; the rest of the tree is still scanned.
+    """
+    out = {ext: [] for ext in exts}
+    buckets = {}
+    for ext in exts:
+        buckets.setdefault(ext.lower(), out[ext])
+    stack = [root]
+    while stack:
+        folder = stack.pop()
+        try:
+            if folder_mtimes is not None:
+                folder_mtimes[os.fspath(folder)] = os.stat(folder).st_mtime
+            with os.scandir(folder) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        continue
+                    name = entry.name
+                    dot = name.rfind('.')
+                    if dot < 0:
+                        continue
+                    bucket = buckets.get(name[dot:].lower())
+                    if bucket is not None:
+                        bucket.append(name[:dot] if dot else name)
+        except OSError as e:
+            print(f"[find_asset_stems] Skipping unreadable folder {folder}: {e}")
+    return out
+
+
+def _close_menu(owner='MenuHandler'):
+    """
+    Close whichever menu is open by setting LEVEL_EDITOR.menu_handler.state to 'None'.
+
+    Args:
+        owner (str): Name of the calling class, used as the prefix of the log message if closing fails.
+
+    Error handling:
+    - Catches any exception (e.g. LEVEL_EDITOR or its menu_handler missing) and logs it instead of raising.
+    """
+    try:
+        LEVEL_EDITOR.menu_handler.state = _STATE_NONE  # type: ignore
+    except Exception as e:
+        print(f"[{owner}] Could not close menu (setting state to 'None'): {e}")
+
+
 class AssetMenu(ButtonList):
     """
     AssetMenu is a popup menu that displays a list of available assets (e.g., textures, models) as buttons.
@@ -4019,24 +4320,16 @@ class ModelMenu(AssetMenu):
 
         Error handling:
         - If `application.asset_folder` is missing or cannot be accessed, logs an error and proceeds with the default names.
-        - If a glob operation fails for any particular file type, logs the exception and continues collecting other types.
+        - The folder scan is cached by `find_asset_stems`, so reopening the menu doesn't touch the disk again.
         """
         # Start with some placeholder model names that the engine recognizes
         self.asset_names = ['None', 'cube', 'sphere', 'plane']
 
         try:
-            # Attempt to scan for model files in the asset folder
-            for file_type in ('.bam', '.obj', '.ursinamesh'):
-                try:
-                    # Glob for files matching the extension, excluding names containing 'animation'
-                    found_files = application.asset_folder.glob(f'**/*{file_type}')
-                    # Extract the stem (filename without extension) for each file
-                    for e in found_files:
-                        if 'animation' not in e.stem:
-                            self.asset_names.append(e.stem)
-                except Exception as file_error:
-                    # Log issues with scanning this particular file type
-                    print(f"[ModelMenu] Error scanning for '{file_type}' files: {file_error}")
+            # Scan (or reuse the cached scan of) the asset folder, excluding names containing 'animation'
+            for stem in find_asset_stems(('.bam', '.obj', '.ursinamesh')):
+                if 'animation' not in stem:
+                    self.asset_names.append(stem)
         except Exception as folder_error:
             # If the asset_folder attribute doesn't exist or is not accessible
             print(f"[ModelMenu] Could not access application.asset_folder: {folder_error}")
@@ -4068,16 +4361,15 @@ class ModelMenu(AssetMenu):
         try:
             # Ensure there is a selection to process
             selected_list = LEVEL_EDITOR.selection  # type: ignore
-            all_entities = LEVEL_EDITOR.entities    # type: ignore
+            entity_indices = LEVEL_EDITOR.get_entity_indices()  # type: ignore
         except Exception as e:
             print(f"[ModelMenu] Cannot access LEVEL_EDITOR.selection or LEVEL_EDITOR.entities: {e}")
             return
 
         # Record the old and new model names for each selected entity
         for e in selected_list:
-            try:
-                index = all_entities.index(e)
-            except ValueError:
+            index = entity_indices.get(id(e))
+            if index is None:
                 # If this entity is not found in LEVEL_EDITOR.entities, skip it
                 print(f"[ModelMenu] Entity {e} not found in LEVEL_EDITOR.entities.")
                 continue
@@ -4089,10 +4381,7 @@ class ModelMenu(AssetMenu):
         # At this point, `changes` holds entries that could be used by an undo/redo system or similar.
 
         # Close the ModelMenu by resetting the menu handler's state
-        try:
-            LEVEL_EDITOR.menu_handler.state = 'None'  # type: ignore
-        except Exception as e:
-            print(f"[ModelMenu] Could not close menu (setting state to 'None'): {e}")
+        _close_menu('ModelMenu')
 
 
 class TextureMenu(AssetMenu):
@@ -4129,7 +4418,7 @@ class TextureMenu(AssetMenu):
 
         Error handling:
         - If `application.asset_folder` is missing or not accessible, logs an error and proceeds with the default names.
-        - If a glob operation fails for any particular file type, logs the exception and continues collecting other types.
+        - The folder scan is cached by `find_asset_stems`, so reopening the menu doesn't touch the disk again.
         """
         search_for = ''  # Currently empty; could be used to filter by prefix
 
@@ -4137,15 +4426,10 @@ class TextureMenu(AssetMenu):
         self.asset_names = ['None', 'white_cube', 'brick', 'grass_tintable', 'radial_gradient', 'cog']
 
         try:
-            # Attempt to scan for image files in the asset folder
-            for file_type in ('.png', '.jpg', '.jpeg'):
-                try:
-                    found_files = application.asset_folder.glob(f'**/{search_for}*{file_type}')
-                    for e in found_files:
-                        self.asset_names.append(e.stem)
-                except Exception as file_error:
-                    # Log issues with scanning this particular image type
-                    print(f"[TextureMenu] Error scanning for '{file_type}' files: {file_error}")
+            # Scan (or reuse the cached scan of) the asset folder for image files
+            for stem in find_asset_stems(('.png', '.jpg', '.jpeg')):
+                if stem.startswith(search_for):
+                    self.asset_names.append(stem)
         except Exception as folder_error:
             # If asset_folder does not exist or is not accessible
             print(f"[TextureMenu] Could not access application.asset_folder: {folder_error}")
@@ -4162,8 +4446,9 @@ class TextureMenu(AssetMenu):
 
         Behavior:
         - If the selected name is 'None', translates that to None to indicate no texture.
-        - If `self.target_attr` is 'texture', records an undo entry for each selected entity's current texture and then sets the new texture.
-        - Otherwise, treats `self.target_attr` as a shader input name: records an undo entry for the current shader input and sets the shader input to the new value.
+        - If `self.target_attr` is 'texture', sets the new texture on each selected entity, remembering the old one for undo.
+        - Otherwise, treats `self.target_attr` as a shader input name and sets that shader input instead.
+        - Both happen in a single pass over the selection, after which one undo step is recorded.
         - After applying changes, updates the inspector UI and closes the menu by setting LEVEL_EDITOR.menu_handler.state to 'None'.
 
         Error handling:
@@ -4176,46 +4461,39 @@ class TextureMenu(AssetMenu):
 
         try:
             selection = LEVEL_EDITOR.selection  # type: ignore
-            entities = LEVEL_EDITOR.entities     # type: ignore
+            entity_indices = LEVEL_EDITOR.get_entity_indices()  # type: ignore
             undo_system = LEVEL_EDITOR.current_scene.undo  # type: ignore
         except Exception as e:
             print(f"[TextureMenu] Unable to access selection, entities, or undo system: {e}")
             return
 
-        # Apply texture change
-        if self.target_attr == 'texture':
+        # Apply the texture (or shader input) change and collect undo entries in a single pass:
+        # (entity_index, target_attr, old_value, new_value)
+        target_attr = self.target_attr
+        is_texture = target_attr == 'texture'
+        undo_entries = []
+        for e in selection:
             try:
-                # Record an undo entry: (entity_index, 'texture', old_value, new_value)
-                undo_entries = [
-                    (entities.index(e), 'texture', e.texture, name)
-                    for e in selection
-                ]
-                undo_system.record_undo(undo_entries)
-            except Exception as e:
-                print(f"[TextureMenu] Error recording undo for texture change: {e}")
-                # Even if undo fails, proceed to set the texture
-            for e in selection:
-                try:
+                if is_texture:
+                    old_value = e.texture
                     e.texture = name
-                except Exception as e:
-                    print(f"[TextureMenu] Could not set texture '{name}' on entity {e}: {e}")
+                else:
+                    old_value = e.get_shader_input(target_attr)
+                    e.set_shader_input(target_attr, name)
+            except Exception as ent_e:
+                print(f"[TextureMenu] Could not set {target_attr} to '{name}' on entity {e}: {ent_e}")
+                continue
 
-        # Apply shader input change
-        else:
-            try:
-                # Record an undo entry: (entity_index, shader_input_name, old_value, new_value)
-                undo_entries = [
-                    (entities.index(e), self.target_attr, e.get_shader_input(self.target_attr), name)
-                    for e in selection
-                ]
-                undo_system.record_undo(undo_entries)
-            except Exception as e:
-                print(f"[TextureMenu] Error recording undo for shader input '{self.target_attr}': {e}")
-            for e in selection:
-                try:
-                    e.set_shader_input(self.target_attr, name)
-                except Exception as e:
-                    print(f"[TextureMenu] Could not set shader input '{self.target_attr}' to '{name}' on entity {e}: {e}")
+            index = entity_indices.get(id(e))
+            if index is None:
+                print(f"[TextureMenu] Entity {e} not found in LEVEL_EDITOR.entities, not recording undo for it.")
+                continue
+            undo_entries.append((index, target_attr, old_value, name))
+
+        try:
+            undo_system.record_undo(undo_entries)
+        except Exception as e:
+            print(f"[TextureMenu] Error recording undo for '{target_attr}' change: {e}")
 
         # Update the inspector UI to reflect changes
         try:
@@ -4224,10 +4502,7 @@ class TextureMenu(AssetMenu):
             print(f"[TextureMenu] Error updating inspector: {e}")
 
         # Close the menu by resetting the menu handler's state
-        try:
-            LEVEL_EDITOR.menu_handler.state = 'None'  # type: ignore
-        except Exception as e:
-            print(f"[TextureMenu] Could not close menu (setting state to 'None'): {e}")
+        _close_menu('TextureMenu')
 
 
 class ShaderMenu(AssetMenu):
@@ -4235,28 +4510,33 @@ class ShaderMenu(AssetMenu):
     ShaderMenu is a specialized AssetMenu for selecting and assigning shaders to entities in the level editor.
 
     When enabled, it defines a fixed list of available shaders and populates the menu accordingly. Upon selection
-    of a shader, it records the change for undo, applies the new shader to each selected entity via dynamic import
-    (using exec), and updates the inspector UI.
+    of a shader, it records the change for undo, applies the new shader (looked up by name in ursina.shaders)
+    to each selected entity, and updates the inspector UI.
     """
 
+    # The built-in shaders available for assignment; never changes, so it's shared by all instances
+    _ASSET_NAMES = (
+        'unlit_shader',
+        'lit_with_shadows_shader',
+        'triplanar_shader',
+        'matcap_shader',
+        'normals_shader',
+    )
+
     def on_enable(self):
         """
         Called automatically when this ShaderMenu is enabled (i.e., becomes visible).
 
-        - Initializes `self.asset_names` with a predefined list of shader names that the engine supports.
+        - Sets `self.asset_names` to the shader names the engine supports (the class-level `_ASSET_NAMES` tuple).
         - Delegates to the parent on_enable() to build the button dictionary and position the menu.
 
         Error handling:
         - Catches any exceptions during the call to super().on_enable() and logs them without preventing the menu from opening.
         """
-        # Define the list of built-in shaders available for assignment
-        self.asset_names = [
-            'unlit_shader',
-            'lit_with_shadows_shader',
-            'triplanar_shader',
-            'matcap_shader',
-            'normals_shader',
-        ]
+        # Use the fixed tuple of built-in shaders available for assignment
+        self.asset_names = self._ASSET_NAMES
+        # Resolve the shader objects by name once, so selecting one is a dict lookup
+        self.shaders = {name: getattr(ursina_shaders, name, None) for name in self.asset_names}
 
         try:
             # Populate buttons and position the menu via the parent class
@@ -4274,27 +4554,32 @@ class ShaderMenu(AssetMenu):
 
         Behavior:
         - Closes the ShaderMenu by setting LEVEL_EDITOR.menu_handler.state to 'None'.
+        - Looks up the shader object for `name` (resolved from ursina.shaders in on_enable).
         - Records an undo entry: for each selected entity, store (entity_index, 'shader', old_shader, new_shader).
-        - For each selected entity:
-            - Dynamically import the chosen shader module/class using exec.
-            - Assign the imported shader class to the entity's `shader` attribute via exec.
+        - Assigns the shader to each selected entity's `shader` attribute.
         - Updates the inspector UI to reflect the shader change.
 
         Error handling:
+        - If the shader can't be found in ursina.shaders, logs an error and leaves the selection unchanged.
         - If LEVEL_EDITOR.selection or LEVEL_EDITOR.current_scene.undo is missing, logs an error and aborts gracefully.
-        - Catches any exceptions during the dynamic import or assignment (exec) and logs them without halting execution.
+        - Catches any exceptions during the assignment and logs them without halting execution.
         - Catches exceptions when updating the inspector and logs them.
         """
         # Close the menu immediately for user feedback
-        try:
-            LEVEL_EDITOR.menu_handler.state = 'None'  # type: ignore
-        except Exception as e:
-            print(f"[ShaderMenu] Could not close menu (setting state to 'None'): {e}")
+        _close_menu('ShaderMenu')
+
+        # Resolve the shader object by name
+        shader = self.shaders.get(name) if hasattr(self, 'shaders') else None
+        if shader is None:
+            shader = getattr(ursina_shaders, name, None)
+        if shader is None:
+            print(f"[ShaderMenu] No shader named '{name}' in ursina.shaders.")
+            return
 
         # Attempt to record undo entries
         try:
             selection = LEVEL_EDITOR.selection  # type: ignore
-            entities = LEVEL_EDITOR.entities     # type: ignore
+            entity_indices = LEVEL_EDITOR.get_entity_indices()  # type: ignore
             undo_system = LEVEL_EDITOR.current_scene.undo  # type: ignore
         except Exception as e:
             print(f"[ShaderMenu] Unable to access selection, entities, or undo system: {e}")
@@ -4303,7 +4588,7 @@ class ShaderMenu(AssetMenu):
         try:
             # Record an undo entry: (entity_index, 'shader', old_shader, new_shader)
             undo_entries = [
-                (entities.index(e), 'shader', e.shader, name)
+                (entity_indices[id(e)], 'shader', e.shader, shader)
                 for e in selection
             ]
             undo_system.record_undo(undo_entries)
@@ -4314,12 +4599,9 @@ class ShaderMenu(AssetMenu):
         # Apply the shader to each selected entity
         for e in selection:
             try:
-                # Dynamically import the selected shader from ursina.shaders
-                exec(f'from ursina.shaders import {name}')
-                # Assign the imported shader class to the entity's shader attribute
-                exec(f'e.shader = {name}')
-            except Exception as e:
-                print(f"[ShaderMenu] Could not set shader '{name}' on entity {e}: {e}")
+                e.shader = shader
+            except Exception as ent_e:
+                print(f"[ShaderMenu] Could not set shader '{name}' on entity {e}: {ent_e}")
 
         # Update the inspector UI to reflect the change
         try:
@@ -4328,6 +4610,98 @@ class ShaderMenu(AssetMenu):
             print(f"[ShaderMenu] Error updating inspector: {e}")
 
 
+@lru_cache(maxsize=256)
+def _hsv_rgba_cached(h, s, v, a):
+    """RGBA tuple of color.hsv for whole-number slider values, cached; see _hsv_color."""
+    return tuple(color.hsv(h, s * .01, v * .01, a * .01))
+
+
+def _hsv_color(h, s, v, a):
+    """
+    color.hsv for slider values: hue in degrees, saturation/value/alpha in percent.
+
+    The sliders step by 1, so a drag revisits the same few whole-number values and those are served from a
+    cache of plain tuples. Other values (e.g. sliders seeded from an arbitrary color) are converted exactly,
+    without rounding. A new Color is returned every time, so callers may keep or modify it.
+    """
+    if h == int(h) and s == int(s) and v == int(v) and a == int(a):
+        return Color(*_hsv_rgba_cached(int(h), int(s), int(v), int(a)))
+    return color.hsv(h, s * .01, v * .01, a * .01)
+
+
+def _index_runs(indices):
+    """
+    Group sorted `indices` into (start, stop) ranges of consecutive indices, e.g. [0, 1, 2, 5, 6] -> [(0, 3), (5, 7)],
+    so they can be filled with one slice assignment per range instead of one item assignment per index.
+    """
+    runs = []
+    for i in indices:
+        if runs and runs[-1][1] == i:
+            runs[-1][1] = i + 1
+        else:
+            runs.append([i, i + 1])
+    return [tuple(run) for run in runs]
+
+
+class Debouncer:
+    """
+    Trailing-edge debouncer for UI callbacks that fire many times in a row, like slider drags.
+
+    Calling the debouncer (re)schedules `func` to run `delay` seconds after the most recent call, with that
+    call's arguments; earlier pending calls are dropped. `flush()` runs the pending call right away and
+    `cancel()` discards it.
+
+    Attributes:
+        func (callable): The function to call.
+        delay (float): Seconds to wait after the last call before calling `func`.
+    """
+
+    def __init__(self, func, delay=.05):
+        self.func = func
+        self.delay = delay
+        self._args = None
+        self._sequence = None
+
+    @property
+    def pending(self):
+        """Whether a call is waiting to be run."""
+        return self._args is not None
+
+    def __call__(self, *args, schedule=True):
+        """
+        Store `args` for the next call of `func`, replacing any pending ones.
+
+        Args:
+            schedule (bool): Run it after `delay` seconds. If False, it only runs on `flush()`.
+        """
+        self._args = args
+        self._kill_sequence()
+        if schedule:
+            self._sequence = invoke(self._fire, delay=self.delay)
+
+    def flush(self):
+        """Run the pending call now, if there is one."""
+        self._kill_sequence()
+        self._fire()
+
+    def cancel(self):
+        """Drop the pending call without running it."""
+        self._kill_sequence()
+        self._args = None
+
+    def _fire(self):
+        self._sequence = None
+        if self._args is None:
+            return
+        args, self._args = self._args, None
+        self.func(*args)
+
+    def _kill_sequence(self):
+        if self._sequence is not None:
+            self._sequence.kill()
+            self._sequence = None
+
+
 class ColorMenu(Entity):
     """
     ColorMenu provides an interactive HSV and Alpha slider interface for selecting and applying colors to entities
@@ -4340,7 +4714,7 @@ class ColorMenu(Entity):
         """
         Initializes the ColorMenu instance.
 
-        - Creates a semi-transparent background panel (`self.bg`) behind the sliders for visual grouping.
+        - Creates a semi-transparent background panel (`self._panel_bg`) behind the sliders for visual grouping.
         - Initializes four sliders: H (hue), S (saturation), V (value/brightness), and A (alpha/transparency).
           Each slider is configured with its name, range, step size, and a callback (`on_slider_changed`).
         - Configures the background models of each slider to visually represent their color gradients or masks.
@@ -4354,8 +4728,32 @@ class ColorMenu(Entity):
         """
         super().__init__(parent=LEVEL_EDITOR.ui, enabled=False)  # type: ignore
 
+        # Writing the color to the selection and regenerating the slider meshes is debounced: while dragging,
+        # it only happens once the value hasn't changed for `apply_delay` seconds. With `continuous` set to
+        # False it only happens when the mouse is released.
+        self.continuous = True
+        self.apply_delay = .05
+        self._apply_color_debounced = Debouncer(self._apply_color, delay=self.apply_delay)
+
+        # Set in on_enable: the entities to color and whether to set `color` or the shader input `_attr_name`
+        self._targets = []
+        self._is_shader_input = False
+        self._attr_name = 'color'
+        # Also set in on_enable and cleared in close: the Inspector's color field, so the slider callbacks
+        # don't walk the LEVEL_EDITOR attribute chain on every change
+        self._color_field = None
+
+        # Set when a slider background's vertex colors changed; update() regenerates the model at most once per frame
+        self._s_dirty = False
+        self._v_dirty = False
+        # The tint last written to the saturation/value slider backgrounds
+        self._s_tint = None
+        self._v_tint = None
+        # True while on_enable sets the four slider values, so on_slider_changed ignores those intermediate changes
+        self._syncing = False
+
         # Semi-transparent background rectangle for the slider panel
-        self.bg = Entity(
+        self._panel_bg = Entity(
             parent=self,
             collider='box',
             z=.1,
@@ -4386,10 +4784,18 @@ class ColorMenu(Entity):
         )
         try:
             self.s_slider.bg.color = color.white
-            # Set all vertices of the background model to white initially
-            self.s_slider.bg.model.colors = [color.white for _ in self.s_slider.bg.model.vertices]
+            # Indices of the background vertices left of the center (always gray) and right of it
+            # (tinted with the current hue/value), computed once instead of on every slider change
+            self._s_neg_idx = [i for i, v in enumerate(self.s_slider.bg.model.vertices) if v[0] < 0]
+            self._s_pos_idx = [i for i, v in enumerate(self.s_slider.bg.model.vertices) if v[0] >= 0]
+            self._s_pos_runs = _index_runs(self._s_pos_idx)
+            # Set all vertices of the background model to white initially, the negative side never changes from gray
+            self.s_slider.bg.model.colors = [color.white] * len(self.s_slider.bg.model.vertices)
+            for i in self._s_neg_idx:
+                self.s_slider.bg.model.colors[i] = color.gray
         except Exception as e:
             print(f"[ColorMenu] Error configuring s_slider background: {e}")
+            self._s_neg_idx, self._s_pos_idx, self._s_pos_runs = [], [], []
 
         # Value (brightness) slider: range 0–100, initial default 50, black-to-white gradient background
         self.v_slider = Slider(
@@ -4397,11 +4803,15 @@ class ColorMenu(Entity):
             world_parent=self, on_value_changed=self.on_slider_changed
         )
         try:
+            # Indices of the background vertices right of the center, tinted with the current hue/saturation
+            self._v_pos_idx = [i for i, v in enumerate(self.v_slider.bg.model.vertices) if v[0] > 0]
+            self._v_pos_runs = _index_runs(self._v_pos_idx)
             # Initially color all vertices black, then overlay white background to allow dynamic update
-            self.v_slider.bg.model.colors = [color.black for _ in self.v_slider.bg.model.vertices]
+            self.v_slider.bg.model.colors = [color.black] * len(self.v_slider.bg.model.vertices)
             self.v_slider.bg.color = color.white
         except Exception as e:
             print(f"[ColorMenu] Error configuring v_slider background: {e}")
+            self._v_pos_idx, self._v_pos_runs = [], []
 
         # Alpha slider: range 0–100, initial default 100, white background with left side transparent
         self.a_slider = Slider(
@@ -4409,16 +4819,18 @@ class ColorMenu(Entity):
             world_parent=self, on_value_changed=self.on_slider_changed
         )
         try:
+            # Indices of the background vertices left of the center, which are transparent to represent 0% alpha
+            self._a_neg_idx = [i for i, v in enumerate(self.a_slider.bg.model.vertices) if v[0] < 0]
             # Start by setting all vertices of the alpha background to white
-            self.a_slider.bg.model.colors = [color.white for _ in self.a_slider.bg.model.vertices]
+            colors = [color.white] * len(self.a_slider.bg.model.vertices)
+            for i in self._a_neg_idx:
+                colors[i] = color.clear
+            self.a_slider.bg.model.colors = colors
             self.a_slider.bg.color = color.white
-            # Make the left half of the alpha slider background transparent to represent 0% alpha
-            for i, v in enumerate(self.a_slider.bg.model.vertices):
-                if v[0] < 0:
-                    self.a_slider.bg.model.colors[i] = color.clear
             self.a_slider.bg.model.generate()
         except Exception as e:
             print(f"[ColorMenu] Error configuring a_slider background: {e}")
+            self._a_neg_idx = []
 
         # Position each slider vertically underneath the top of the panel and set knob color
         for i, slider in enumerate((self.h_slider, self.s_slider, self.v_slider, self.a_slider)):
@@ -4450,109 +4862,165 @@ class ColorMenu(Entity):
         """
         Callback invoked whenever any of the H, S, V, or A sliders change value.
 
+        - Returns immediately while on_enable is syncing the sliders (`self._syncing`).
         - Computes the combined HSV + alpha color from the slider values.
-        - If `self.apply_color` is True, updates:
-            - The preview color in the Inspector's color field.
-            - The actual color (or shader input) of all selected entities in LEVEL_EDITOR.selection.
-        - Dynamically updates the saturation and value slider backgrounds to reflect the newly chosen hue/value.
-        - Updates the alpha slider's knob color to match the chosen color.
+        - Immediately updates the cheap previews: the Inspector's color field (if `self.apply_color` is True)
+          and the alpha slider's background color.
+        - Schedules the expensive part (`_apply_color`: writing the color to the selected entities and
+          regenerating the saturation/value slider backgrounds) through a trailing-edge debouncer, so a
+          slider drag only triggers it once the value has settled for `apply_delay` seconds. If
+          `self.continuous` is False it only runs on mouse release instead.
 
         Error handling:
-        - Wraps entity updates and model color regenerations in try-except blocks to log and skip errors
-          without stopping the application.
+        - Computing the color and updating the previews is guarded by a single try-except; errors go through
+          `_report_update_error`, so an error repeating at UI rate is only printed again while LEVEL_EDITOR.debug is True.
         """
+        if self._syncing:
+            return
+
         try:
-            # Compute the new color from HSV + alpha sliders
-            h = self.h_slider.value
-            s = self.s_slider.value / 100
-            v = self.v_slider.value / 100
-            a = self.a_slider.value / 100
-            value = color.hsv(h, s, v, a)
+            # Compute the new color from HSV + alpha sliders, cached per whole-number slider combination
+            value = _hsv_color(
+                self.h_slider.value,
+                self.s_slider.value,
+                self.v_slider.value,
+                self.a_slider.value,
+            )
+
+            # If apply_color is True, show the new color in the inspector preview right away
+            if self.apply_color and self._color_field is not None:
+                self._color_field.preview.color = value
+
+            # Set the alpha slider's background color to the newly selected color (to show transparency effect)
+            self.a_slider.bg.color = value
         except Exception as e:
-            print(f"[ColorMenu] Error computing HSV color: {e}")
+            _report_update_error('[ColorMenu]', 'Error computing or previewing HSV color', e)
             return
 
-        # If apply_color is True, propagate the new color to inspector preview and selected entities
-        if self.apply_color:
-            try:
-                # Update the Inspector's color preview
-                inspector_color_field = LEVEL_EDITOR.inspector.fields['color']  # type: ignore
-                inspector_color_field.preview.color = value
-                # If the color field is not a shader input, assign the direct color attribute
-                if not inspector_color_field.is_shader_input:
-                    for e in LEVEL_EDITOR.selection:  # type: ignore
-                        try:
-                            e.color = value
-                        except Exception as ent_e:
-                            print(f"[ColorMenu] Could not set entity color for {e}: {ent_e}")
-                else:
-                    # If the Inspector's color field represents a shader input, set_shader_input instead
-                    attr_name = inspector_color_field.attr_name
-                    for e in LEVEL_EDITOR.selection:  # type: ignore
-                        try:
-                            e.set_shader_input(attr_name, value)
-                        except Exception as ent_e:
-                            print(f"[ColorMenu] Could not set shader input '{attr_name}' for {e}: {ent_e}")
-            except Exception as insp_e:
-                print(f"[ColorMenu] Error updating inspector preview or applying to entities: {insp_e}")
+        # Apply to entities and regenerate slider backgrounds once the value settles (or on release)
+        self._apply_color_debounced(value, self.apply_color, schedule=self.continuous)
 
-        # Update saturation slider background to reflect new hue and value
-        try:
-            for i, vertex in enumerate(self.s_slider.bg.model.vertices):
-                if vertex[0] < 0:
-                    # Grayed-out area for negative x-coordinates (unused region)
-                    self.s_slider.bg.model.colors[i] = color.gray
-                else:
-                    # Color the vertex with full saturation, current hue, and current value
-                    self.s_slider.bg.model.colors[i] = color.hsv(value.h, 1, value.v)
-            self.s_slider.bg.model.generate()
-        except Exception as e:
-            print(f"[ColorMenu] Error updating saturation slider background: {e}")
+    def _apply_color(self, value, apply_color):
+        """
+        Apply `value` to the selected entities (if `apply_color` is True) and update the saturation and value
+        slider backgrounds to match it. Called through `self._apply_color_debounced`. The background models
+        are only marked dirty here and regenerated in `update`.
 
-        # Update value slider background to reflect new hue and saturation
-        try:
-            for i, vertex in enumerate(self.v_slider.bg.model.vertices):
-                if vertex[0] > 0:
-                    # Color the vertex with current hue, current saturation, and full brightness
-                    self.v_slider.bg.model.colors[i] = color.hsv(value.h, value.s, 1)
-            self.v_slider.bg.model.generate()
-        except Exception as e:
-            print(f"[ColorMenu] Error updating value slider background: {e}")
+        Args:
+            value (Color): The color chosen with the sliders.
+            apply_color (bool): The value of `self.apply_color` when the change happened. Changes made while
+                syncing the sliders in on_enable must not be written to the entities.
+        """
+        # Propagate the new color to the entities that were selected when the menu opened
+        if apply_color:
+            targets = self._targets
+            # If the color field is not a shader input, assign the direct color attribute
+            if not self._is_shader_input:
+                for e in targets:
+                    try:
+                        e.color = value
+                    except Exception as ent_e:
+                        _report_update_error('[ColorMenu]', 'Could not set entity color', ent_e)
+            else:
+                # If the Inspector's color field represents a shader input, set_shader_input instead.
+                # Called on each entity, so subclasses that override set_shader_input are respected.
+                attr_name = self._attr_name
+                for e in targets:
+                    try:
+                        e.set_shader_input(attr_name, value)
+                    except Exception as ent_e:
+                        _report_update_error('[ColorMenu]', f"Could not set shader input '{attr_name}'", ent_e)
 
-        # Set the alpha slider's background color to the newly selected color (to show transparency effect)
         try:
-            self.a_slider.bg.color = value
+            # Update saturation slider background to reflect new hue and value.
+            # Only the right side changes; the gray left side was filled in once in __init__.
+            # Skipped when the tint is the one already written, e.g. when only the alpha or saturation changed.
+            c_sat = color.hsv(value.h, 1, value.v)
+            if c_sat != self._s_tint:
+                colors = self.s_slider.bg.model.colors
+                for start, stop in self._s_pos_runs:
+                    # Color the vertices with full saturation, current hue, and current value
+                    colors[start:stop] = [c_sat] * (stop - start)
+                self._s_tint = c_sat
+                self._s_dirty = True
+
+            # Update value slider background to reflect new hue and saturation
+            c_val = color.hsv(value.h, value.s, 1)
+            if c_val != self._v_tint:
+                colors = self.v_slider.bg.model.colors
+                for start, stop in self._v_pos_runs:
+                    # Color the vertices with current hue, current saturation, and full brightness
+                    colors[start:stop] = [c_val] * (stop - start)
+                self._v_tint = c_val
+                self._v_dirty = True
         except Exception as e:
-            print(f"[ColorMenu] Error updating alpha slider color: {e}")
+            _report_update_error('[ColorMenu]', 'Error updating slider backgrounds', e)
+
+    def update(self):
+        """
+        Regenerate the saturation/value slider background models if their colors changed since the last frame,
+        so several changes within one frame cause a single vertex upload per model.
+        """
+        if self._s_dirty:
+            self._s_dirty = False
+            try:
+                self.s_slider.bg.model.generate()
+            except Exception as e:
+                _report_update_error('[ColorMenu]', 'Error regenerating saturation slider background', e)
+        if self._v_dirty:
+            self._v_dirty = False
+            try:
+                self.v_slider.bg.model.generate()
+            except Exception as e:
+                _report_update_error('[ColorMenu]', 'Error regenerating value slider background', e)
+
+    def input(self, key):
+        """
+        When `continuous` is off, apply the pending color once the slider is released.
+        """
+        if key == 'left mouse up' and not self.continuous:
+            self._apply_color_debounced.flush()
 
     def on_enable(self):
         """
         Called automatically when the ColorMenu is enabled (made visible).
 
+        - Caches the selected entities and the Inspector color field's target (`color` or a shader input),
+          which `_apply_color` writes to.
         - Records the original color of each selected entity in `e.original_color` so undo can revert later.
         - Temporarily disables color application (`apply_color = False`) while sliders are synced to the current color.
-        - Reads the current HSV and alpha values from the Inspector's color preview and sets the slider values.
+        - Reads the current HSV and alpha values from the Inspector's color preview and sets the slider values,
+          with `_syncing` set so the four changes are handled by a single on_slider_changed call afterwards.
         - Re-enables color application (`apply_color = True`) so further slider movements update entity colors.
 
         Error handling:
-        - Wraps all operations in try-except blocks to avoid crashing if selection is empty or Inspector fields are missing.
+        - Reading the selection/Inspector state and syncing the sliders are each guarded by one try-except,
+          so an empty selection or missing Inspector field is logged without crashing.
         """
+        inspector_color_field = None
         try:
+            # Remember what the sliders will apply to: the selected entities and whether the inspector's
+            # color field is the entity color or a shader input
+            self._targets = list(LEVEL_EDITOR.selection)  # type: ignore
+            inspector_color_field = LEVEL_EDITOR.inspector.fields['color']  # type: ignore
+            self._color_field = inspector_color_field
+            self._is_shader_input = inspector_color_field.is_shader_input
+            self._attr_name = inspector_color_field.attr_name
+
             # Save each selected entity's current color for undo
-            for e in LEVEL_EDITOR.selection:  # type: ignore
-                try:
-                    e.original_color = e.color
-                except Exception as ent_e:
-                    print(f"[ColorMenu] Could not record original color for {e}: {ent_e}")
-        except Exception as sel_e:
-            print(f"[ColorMenu] Error iterating over LEVEL_EDITOR.selection: {sel_e}")
+            for e in self._targets:
+                e.original_color = e.color
+        except Exception as exc:
+            print(f"[ColorMenu] Error reading selection or inspector color field: {exc}")
 
         # Prevent slider changes from immediately updating entity colors
         self.apply_color = False
 
+        # Set the four slider values without reacting to each one, then update the slider backgrounds once
+        self._syncing = True
         try:
             # Fetch the current color from the Inspector's preview and decompose into HSV + alpha
-            preview_color = LEVEL_EDITOR.inspector.fields['color'].preview.color  # type: ignore
+            preview_color = inspector_color_field.preview.color
             # Set slider values based on the preview color
             self.h_slider.value = preview_color.h
             self.s_slider.value = preview_color.s * 100
@@ -4560,6 +5028,9 @@ class ColorMenu(Entity):
             self.a_slider.value = preview_color.a * 100
         except Exception as insp_e:
             print(f"[ColorMenu] Error syncing sliders to inspector preview: {insp_e}")
+        finally:
+            self._syncing = False
+        self.on_slider_changed()
 
         # Re-enable color application so that moving sliders now updates entity colors
         self.apply_color = True
@@ -4568,27 +5039,33 @@ class ColorMenu(Entity):
         """
         Closes the ColorMenu and finalizes the color change.
 
+        - Applies any pending (debounced) color change.
         - Sets the menu handler's state to 'None' to hide this menu.
         - Records an undo entry for each selected entity as (entity_index, 'color', old_color, new_color).
-        
+        - Drops the references cached in on_enable.
+
         Error handling:
         - Wraps state change and undo recording in try-except blocks to log errors without crashing.
         """
-        try:
-            LEVEL_EDITOR.menu_handler.state = 'None'  # type: ignore
-        except Exception as e:
-            print(f"[ColorMenu] Could not close menu (setting state to 'None'): {e}")
+        # Make sure the last slider change has reached the entities before recording it
+        self._apply_color_debounced.flush()
+
+        _close_menu('ColorMenu')
 
         try:
-            # Build a list of undo tuples for the selected entities
+            # Build a list of undo tuples for the selected entities, recorded as a single undo step
+            entity_indices = LEVEL_EDITOR.get_entity_indices()  # type: ignore
             undo_entries = [
-                (LEVEL_EDITOR.entities.index(e), 'color', e.original_color, e.color)  # type: ignore
+                (entity_indices[id(e)], 'color', e.original_color, e.color)
                 for e in LEVEL_EDITOR.selection  # type: ignore
             ]
             LEVEL_EDITOR.current_scene.undo.record_undo(undo_entries)  # type: ignore
         except Exception as e:
             print(f"[ColorMenu] Error recording undo for color change: {e}")
 
+        self._color_field = None
+        self._targets = []
+
 
 class ColliderMenu(AssetMenu):
     """
@@ -4598,18 +5075,21 @@ class ColliderMenu(AssetMenu):
     of a collider type, it assigns that collider_type to each selected entity, updates the inspector, and closes the menu.
     """
 
+    # The collider types that the engine supports; never changes, so it's shared by all instances
+    _ASSET_NAMES = ('None', 'box', 'sphere', 'mesh')
+
     def on_enable(self):
         """
         Called automatically when this ColliderMenu is enabled (i.e., becomes visible).
 
-        - Initializes `self.asset_names` with a predefined list of collider types: 'None', 'box', 'sphere', 'mesh'.
+        - Sets `self.asset_names` to the collider types 'None', 'box', 'sphere', 'mesh' (the class-level `_ASSET_NAMES` tuple).
         - Delegates to the parent on_enable() to build the button dictionary and position the menu.
 
         Error handling:
         - Catches any exceptions during the call to super().on_enable() and logs them without preventing the menu from opening.
         """
-        # Define the list of collider types that the engine supports
-        self.asset_names = ['None', 'box', 'sphere', 'mesh']
+        # Use the fixed tuple of collider types that the engine supports
+        self.asset_names = self._ASSET_NAMES
 
         try:
             # Populate buttons and position the menu via the parent class
@@ -4646,10 +5126,7 @@ class ColliderMenu(AssetMenu):
         except Exception as e:
             print(f"[ColliderMenu] Unable to access LEVEL_EDITOR.selection: {e}")
             # Attempt to close the menu even if selection cannot be accessed
-            try:
-                LEVEL_EDITOR.menu_handler.state = 'None'  # type: ignore
-            except Exception:
-                pass
+            _close_menu('ColliderMenu')
             return
 
         # Assign the new collider_type to each selected entity
@@ -4666,10 +5143,7 @@ class ColliderMenu(AssetMenu):
             print(f"[ColliderMenu] Error updating inspector: {insp_e}")
 
         # Close the menu by resetting the menu handler's state
-        try:
-            LEVEL_EDITOR.menu_handler.state = 'None'  # type: ignore
-        except Exception as mh_e:
-            print(f"[ColliderMenu] Could not close menu (setting state to 'None'): {mh_e}")
+        _close_menu('ColliderMenu')
 
 
 class ClassMenu(AssetMenu):
@@ -4688,6 +5162,8 @@ class ClassMenu(AssetMenu):
         - Calls the parent AssetMenu __init__ to set up base popup behavior.
         - Initializes `available_classes` as a dictionary mapping display names (strings) to actual class references
           or None. By default, only 'None' is available, meaning no class will be spawned.
+        - Sets up the cached tuple of names shown in the menu, rebuilt only when `_classes_version` changes
+          (see register_class/unregister_class).
         
         Error handling:
         - None required here, as logic is straightforward. Any missing parent functionality will raise normally.
@@ -4695,20 +5171,58 @@ class ClassMenu(AssetMenu):
         super().__init__(**kwargs)
         # A mapping from asset name (string) to the actual class reference or None
         self.available_classes = {'None': None}
+        # Snapshot of the available class names and the version of available_classes it was taken at
+        self._classes_version = 0
+        self._asset_names_cache = None
+        self._asset_names_version = -1
+
+    def register_class(self, name, cls):
+        """
+        Make `cls` selectable in the menu under `name`, replacing any class already registered with that name.
+
+        Args:
+            name (str): The name shown in the menu and stored in `class_to_spawn`.
+            cls (type or None): The class to instantiate for entities with this class_to_spawn.
+        """
+        self.available_classes[name] = cls
+        self._classes_version += 1
+
+    def unregister_class(self, name):
+        """
+        Remove the class registered under `name` from the menu. Does nothing if no such class is registered.
+
+        Args:
+            name (str): The name the class was registered under.
+        """
+        if name in self.available_classes:
+            del self.available_classes[name]
+            self._classes_version += 1
+
+    def _get_asset_names(self):
+        """
+        Return a tuple snapshot of the names in `available_classes`, reusing the previous one unless classes were
+        registered/unregistered since, or available_classes was modified directly and changed size.
+        """
+        cache = self._asset_names_cache
+        if (cache is None or self._asset_names_version != self._classes_version
+                or len(cache) != len(self.available_classes)):
+            cache = self._asset_names_cache = tuple(self.available_classes)
+            self._asset_names_version = self._classes_version
+        return cache
 
     def on_enable(self):
         """
         Called automatically when this ClassMenu is enabled (i.e., becomes visible).
 
-        - Populates `self.asset_names` with the keys from `available_classes` so that each entry
+        - Populates `self.asset_names` with a tuple snapshot of the keys of `available_classes` so that each entry
           becomes a button in the popup.
         - Delegates to the parent on_enable() to build the button dictionary and position the menu.
 
         Error handling:
         - Catches any exceptions during the call to super().on_enable() and logs them without preventing the menu from opening.
         """
-        # Use the keys of available_classes as the list of names to display
-        self.asset_names = self.available_classes.keys()
+        # Use the names in available_classes as the list of names to display
+        self.asset_names = self._get_asset_names()
 
         try:
             # Populate buttons and position the menu via the parent class
@@ -4744,16 +5258,13 @@ class ClassMenu(AssetMenu):
         except Exception as e:
             print(f"[ClassMenu] Unable to access LEVEL_EDITOR.selection: {e}")
             # Close the menu even if selection can't be accessed
-            try:
-                LEVEL_EDITOR.menu_handler.state = 'None'  # type: ignore
-            except Exception:
-                pass
+            _close_menu('ClassMenu')
             return
 
         for e in selection:
             try:
-                # Only set if the entity supports this attribute
-                if hasattr(e, 'class_to_spawn'):
+                # Only set if the entity supports this attribute (getattr with a sentinel instead of hasattr)
+                if getattr(e, 'class_to_spawn', _MISSING) is not _MISSING:
                     e.class_to_spawn = selected_class
                 else:
                     print(f"[ClassMenu] Entity {e} has no attribute 'class_to_spawn'. Skipping.")
@@ -4767,10 +5278,30 @@ class ClassMenu(AssetMenu):
             print(f"[ClassMenu] Error updating inspector: {insp_e}")
 
         # Close the menu by resetting the menu handler's state
-        try:
-            LEVEL_EDITOR.menu_handler.state = 'None'  # type: ignore
-        except Exception as mh_e:
-            print(f"[ClassMenu] Could not close menu (setting state to 'None'): {mh_e}")
+        _close_menu('ClassMenu')
+
+
+# Hotkey listing shown by the Help tooltip, dedented once at import instead of on every Help construction
+_HOTKEYS_TEXT = dedent('''
+        Hotkeys:
+        n:          add new cube
+
+        d:          quick drag
+        w:          move tool
+        x/y/z:      hold to quick move on axis
+
+        c:          quick rotate on y axis
+        t:          tilt
+
+        e:          scale tool
+        s:          quick scale
+        s + x/y/z:  quick scale on axis
+
+        f:          move editor camera to point
+        shift+f:    reset editor camera position
+        shift+p:    toggle perspective/orthographic
+        shift+d:    duplicate
+    ''').strip()
 
 
 class Help(Button):
@@ -4779,20 +5310,19 @@ class Help(Button):
 
     Attributes:
         tooltip (Text): A Text entity that appears near the Help button and shows hotkey information when enabled.
+            None until the button is hovered for the first time.
         tooltip.original_scale (float): Stores the intended scale for the tooltip text, for potential future toggling.
     """
 
     def __init__(self, **kwargs):
         """
-        Initializes the Help button and its associated tooltip.
+        Initializes the Help button.
 
         - Creates a Button with a question mark ('?') icon, positioned at the top-left of the window.
-        - Creates a Text entity for the tooltip, positioned slightly offset from the button, initially disabled.
-        - Sets the tooltip's background color to black and records its original scale.
+        - Defers creating the tooltip Text until the button is first hovered (`self.tooltip` stays None until then).
 
         Error handling:
         - Catches exceptions when accessing LEVEL_EDITOR.ui or window.top_left to avoid crashes if those references are missing.
-        - Wraps Text creation and attribute assignments in try-except blocks to log any errors during initialization.
         """
         try:
             # Create the Help button, anchored at the top-left of the window
@@ -4811,39 +5341,34 @@ class Help(Button):
             # Call Button.__init__ without parent or position to avoid breaking the application
             super().__init__(text='?', scale=.025, model='circle', origin=(-.5, .5), text_origin=(0, 0))
 
-        # Build the multi-line hotkeys string using dedent
-        try:
-            hotkeys_text = dedent('''
-                Hotkeys:
-                n:          add new cube
-
-                d:          quick drag
-                w:          move tool
-                x/y/z:      hold to quick move on axis
-
-                c:          quick rotate on y axis
-                t:          tilt
-
-                e:          scale tool
-                s:          quick scale
-                s + x/y/z:  quick scale on axis
-
-                f:          move editor camera to point
-                shift+f:    reset editor camera position
-                shift+p:    toggle perspective/orthographic
-                shift+d:    duplicate
-            ''').strip()
-        except Exception as e:
-            print(f"[Help] Error preparing tooltip text: {e}")
-            hotkeys_text = "Hotkeys information unavailable."
+        # The hotkeys string is built once at import (see _HOTKEYS_TEXT)
+        self._hotkeys_text = _HOTKEYS_TEXT
+
+        # The tooltip Text is only created when the button is first hovered (see _create_tooltip).
+        # Its size settings are filled in by LevelEditor once the window size is known.
+        self.tooltip = None
+        self._tooltip_init_w = self._tooltip_init_h = None
+        self._tooltip_base_ui_scale = .5
 
+    def _create_tooltip(self):
+        """
+        Create the tooltip Text entity listing the hotkeys.
+
+        - Creates a Text entity for the tooltip, positioned slightly offset from the button, initially disabled.
+        - Sets the tooltip's background color to black and records its original scale.
+        - Copies the window-size based scaling settings onto the tooltip and applies them, so LevelEditor.update
+          can keep resizing it.
+
+        Error handling:
+        - Wraps Text creation and attribute assignments in try-except blocks to log any errors during creation.
+        """
         try:
             # Create the tooltip Text entity, positioned offset from the button
             self.tooltip = Text(
                 position=self.position + Vec3(.05, - .05, -10),  # Slightly to the right and down, and behind in z
                 font=Text.default_monospace_font,                # Use a monospace font for alignment
                 enabled=False,                                    # Tooltip is hidden initially
-                text=hotkeys_text,                                # The hotkey information string
+                text=self._hotkeys_text,                          # The hotkey information string
                 background=True,                                  # Show a background rectangle behind the text
                 scale=.5                                          # Scale down the tooltip text for readability
             )
@@ -4869,6 +5394,23 @@ class Help(Button):
             except Exception as e:
                 print(f"[Help] Error setting tooltip.original_scale: {e}")
 
+            try:
+                # Scale it the same way LevelEditor.update does
+                self.tooltip._init_w, self.tooltip._init_h = self._tooltip_init_w, self._tooltip_init_h
+                self.tooltip._base_ui_scale = self._tooltip_base_ui_scale
+                cur_w, _ = window.size
+                self.tooltip.scale = max(0.7, self._tooltip_base_ui_scale * cur_w / (self._tooltip_init_w or cur_w))
+            except Exception as e:
+                print(f"[Help] Error scaling tooltip: {e}")
+
+    def on_mouse_enter(self):
+        """
+        Create the tooltip on first hover, then let Button show it.
+        """
+        if self.tooltip is None:
+            self._create_tooltip()
+        super().on_mouse_enter()
+
 
 class Duplicator(Entity):
     """
@@ -4877,18 +5419,37 @@ class Duplicator(Entity):
     positioning, and supports axis locking for constrained movement.
     """
 
+    # Fixed set of Duplicator-specific attributes, stored in slots instead of the instance __dict__ for faster
+    # access from update(). Entity itself isn't slotted, so the engine's own attributes still live in __dict__.
+    __slots__ = (
+        'clones', 'plane', 'dragger', 'axis_lock_gizmo', '_built', 'dragging', 'start_position',
+        'clone_from_position', 'axis_lock', '_lock_mask', '_lock_offset', 'update_interval',
+        '_last_update_time', '_pending_undo', '_clone_pool',
+    )
+
+    # Entity types whose clones can be recycled into the clone pool. Their state is made up of their
+    # default_values and the few display attributes _reset_pooled also copies, unlike prefabs with their own settings.
+    _POOLABLE_TYPES = (Entity, WhiteCube)
+    # Maximum number of recycled entities kept per type
+    clone_pool_size = 256
+
+    # Scale and color of the axis-lock gizmo for each axis: magenta for X, yellow for Y, cyan for Z
+    _AXIS_LOCK_GIZMO_STYLES = (
+        (Vec3(100, .01, .01), color.magenta),
+        (Vec3(.01, 100, .01), color.yellow),
+        (Vec3(.01, .01, 100), color.cyan),
+    )
+
     def __init__(self, **kwargs):
         """
         Initializes the Duplicator instance.
 
         - Attaches this entity to LEVEL_EDITOR as its parent.
-        - Creates a large invisible plane to act as the dragging surface.
-        - Creates a Draggable gizmo to represent the dragging handle.
         - Initializes state variables for tracking dragging, cloning, and axis locking.
-        - Creates three axis-lock gizmos (magenta for X, yellow for Y, cyan for Z), parented to the dragger.
+        - The drag plane, dragger and axis-lock gizmos are only created on the first duplication (see _ensure_built).
 
         Error handling:
-        - Wraps critical entity creation in try-except blocks to log failures without crashing.
+        - Falls back to an unparented entity if LEVEL_EDITOR can't be used as the parent.
         """
         try:
             super().__init__(parent=LEVEL_EDITOR, clones=None)  # type: ignore
@@ -4896,6 +5457,39 @@ class Duplicator(Entity):
             print(f"[Duplicator] Error attaching to LEVEL_EDITOR: {e}")
             super().__init__(clones=None)
 
+        # Created by _ensure_built
+        self._built = False
+        self.plane = None
+        self.dragger = None
+        self.axis_lock_gizmo = None
+
+        # State variables
+        self.dragging = False              # Whether we are currently dragging clones
+        self.start_position = None         # The starting world position of the drag
+        self.clone_from_position = None    # The original position of the cloned entity (for reference)
+        self.axis_lock = None              # Which axis is locked (0=X, 1=Y, 2=Z), or None for no lock
+        self._lock_mask = Vec3(1, 1, 1)    # Per-axis factor applied to the mouse point for the current axis lock
+        self._lock_offset = Vec3(0, 0, 0)  # Per-axis value added for the coordinates the axis lock keeps fixed
+        self.update_interval = 1 / 60      # Seconds between dragger updates while dragging (60 Hz cap)
+        self._last_update_time = 0.0       # perf_counter() time of the last dragger update
+        self._pending_undo = None          # (first index, clones, recipes) of the clones being placed
+        self._clone_pool = {}              # Entity type -> disabled entities kept for reuse (see recycle)
+
+    def _ensure_built(self):
+        """
+        Create the entities used while dragging clones, the first time they're needed:
+
+        - A large invisible plane to act as the dragging surface.
+        - A Draggable gizmo to represent the dragging handle.
+        - One axis-lock gizmo parented to the dragger, styled per locked axis (see _AXIS_LOCK_GIZMO_STYLES).
+
+        Error handling:
+        - Wraps entity creation in try-except blocks to log failures without crashing. Creation isn't retried.
+        """
+        if self._built:
+            return
+        self._built = True
+
         # Create an invisible plane that will capture mouse interactions when dragging clones
         try:
             self.plane = Entity(
@@ -4921,99 +5515,288 @@ class Duplicator(Entity):
             print(f"[Duplicator] Error creating dragger: {e}")
             self.dragger = None
 
-        # State variables
-        self.dragging = False              # Whether we are currently dragging clones
-        self.start_position = None         # The starting world position of the drag
-        self.clone_from_position = None    # The original position of the cloned entity (for reference)
-        self.axis_lock = None              # Which axis is locked (0=X, 1=Y, 2=Z), or None for no lock
-
-        # Create axis-lock gizmos: large thin cubes along each axis, initially disabled
-        self.axis_lock_gizmos = []
+        # Create the axis-lock gizmo: a large thin cube, initially disabled. Only one axis is ever locked,
+        # so a single gizmo is restyled for the locked axis (see _set_axis_lock) instead of keeping one per axis.
         try:
-            # X-axis gizmo (magenta)
-            gizmo_x = Entity(
+            self.axis_lock_gizmo = Entity(
                 model='cube',
-                scale=Vec3(100, .01, .01),
-                color=color.magenta,
                 parent=self.dragger,
                 unlit=True,
                 enabled=False
             )
-            # Y-axis gizmo (yellow)
-            gizmo_y = Entity(
-                model='cube',
-                scale=Vec3(.01, 100, .01),
-                color=color.yellow,
-                parent=self.dragger,
-                unlit=True,
-                enabled=False
-            )
-            # Z-axis gizmo (cyan)
-            gizmo_z = Entity(
-                model='cube',
-                scale=Vec3(.01, .01, 100),
-                color=color.cyan,
-                parent=self.dragger,
-                unlit=True,
-                enabled=False
-            )
-            self.axis_lock_gizmos = [gizmo_x, gizmo_y, gizmo_z]
         except Exception as e:
-            print(f"[Duplicator] Error creating axis lock gizmos: {e}")
-            # If gizmos cannot be created, leave the list empty
-            self.axis_lock_gizmos = []
+            print(f"[Duplicator] Error creating axis lock gizmo: {e}")
+            self.axis_lock_gizmo = None
+
+    def recycle(self, e):
+        """
+        Take an entity that's being deleted (e.g. by undoing a duplication) and keep it, disabled, for reuse by a
+        later duplication instead of destroying it. Only clones created by this Duplicator are kept; other
+        entities, entities of other types than `_POOLABLE_TYPES`, or those beyond `clone_pool_size` per type,
+        are destroyed as before.
+
+        Args:
+            e (Entity): The entity, already removed from LEVEL_EDITOR.entities and the selection.
+
+        Error handling:
+        - If the entity can't be disabled and reparented, logs the error and destroys it.
+        """
+        if type(e) not in self._POOLABLE_TYPES or not getattr(e, '_duplicator_clone', False):
+            destroy(e)
+            return
+        pool = self._clone_pool.setdefault(type(e), [])
+        if len(pool) >= self.clone_pool_size:
+            destroy(e)
+            return
+        try:
+            e.enabled = False
+            # Parent it to the Duplicator, so unloading the scene it was in doesn't destroy it
+            e.parent = self
+            pool.append(e)
+        except Exception as exc:
+            print(f"[Duplicator] Could not recycle {e}, destroying it: {exc}")
+            destroy(e)
+
+    def _take_pooled(self, e):
+        """
+        Return a recycled entity of the same type as `e`, or None if there is none.
+        """
+        pool = self._clone_pool.get(type(e))
+        while pool:
+            pooled = pool.pop()
+            if not pooled.is_empty():  # Skip entities destroyed while in the pool
+                return pooled
+        return None
+
+    def _reset_pooled(self, clone, e):
+        """
+        Reset a recycled entity completely to `e`'s state, as if it had just been created from e's recipe.
+
+        - Removes the public attributes added to it after it was first created (custom attributes, and the
+          Duplicator's own bookkeeping, which `_clone_entity` sets again).
+        - Clears its scripts, animations and shader inputs.
+        - Gives it a copy of e's model (never e.model itself, which assigning would take from e), then copies
+          every other attribute in its class's `default_values`, plus texture_offset, double_sided, unlit and the
+          collider type.
+
+        Args:
+            clone (Entity): The recycled entity, of the same type as `e`.
+            e (Entity): The entity being duplicated.
+        """
+        base_keys = getattr(clone, '_pool_base_keys', frozenset())
+        for key in [k for k in vars(clone) if not k.startswith('_') and k not in base_keys]:
+            delattr(clone, key)
+        clone.scripts.clear()
+        clone.animations.clear()
+        for shader_key in tuple(clone._shader_inputs):
+            clone.clearShaderInput(shader_key)
+        clone._shader_inputs.clear()
+
+        clone.parent = e.parent
+        clone.model = self._copy_model(e.model)
+        for key in type(e).default_values:
+            if key not in ('model', 'collider', 'enabled'):
+                setattr(clone, key, getattr(e, key))
+        clone.texture_offset = e.texture_offset
+        clone.double_sided = getattr(e, 'double_sided', False)
+        clone.unlit = getattr(e, 'unlit', False)
+        collider_name = getattr(e.collider, 'name', None) if e.collider else None
+        clone.collider = collider_name if isinstance(collider_name, str) and collider_name else None
+        clone.enabled = True
+
+    @staticmethod
+    def _copy_model(model):
+        """
+        Return a copy of `model` that can be assigned to another entity.
+
+        Assigning a model reparents its node to the entity, so sharing the source entity's model would move it
+        away from the source. Meshes are deep-copied (ursina's Mesh.__deepcopy__ rebuilds them from their data);
+        other NodePaths are copied with `copy`, which duplicates the node.
+
+        Args:
+            model (NodePath or None): The model to copy.
+
+        Returns:
+            NodePath or None: The copy, or None if there is no model.
+        """
+        if model is None:
+            return None
+        if isinstance(model, Mesh):
+            return deepcopy(model)
+        return copy(model)
+
+    def _clone_entity(self, e, recipe=None):
+        """
+        Create a copy of `e` for duplication.
+
+        Args:
+            e (Entity): The entity to duplicate.
+            recipe (str, optional): `repr(e)`, if the caller already has it.
+
+        Returns:
+            Entity: The clone.
+
+        Behavior:
+        - Reuses a recycled entity of the same type if there is one (see `recycle`), resetting it completely to
+          e's state (see `_reset_pooled`).
+        - Otherwise, for classes that define their own `__deepcopy__` (PokeShape, SlicedCube, PipeEditor, WhiteCube...),
+          uses `deepcopy(e)`, so the copy is built by the class itself from its module's globals.
+        - For plain entities, constructs the clone from the entity's recipe (`eval(repr(e))`), the same way undo/redo
+          re-creates entities.
+        - Falls back to a plain Entity with a copy of the model, the texture and the transform if neither works.
+        - Copies over the attributes the recipe doesn't carry: original parent, color, shader, origin, shader inputs
+          and collider type, marks the clone selectable and disables its collision.
+
+        Error handling:
+        - Only the recipe evaluation is guarded (it falls back to the plain Entity). Other errors propagate to
+          the duplication loop in `input`, which logs and skips the entity.
+        """
+        clone = self._take_pooled(e)
+        if clone is not None:
+            self._reset_pooled(clone, e)
+        else:
+            try:
+                if type(e).__deepcopy__ is not Entity.__deepcopy__:
+                    clone = deepcopy(e)
+                else:
+                    clone = eval(recipe if recipe is not None else repr(e))
+            except Exception as recipe_e:
+                print(f"[Duplicator] Could not clone {e}, copying its model and transform instead: {recipe_e}")
+                # Never hand e.model itself to the clone: assigning a model reparents it, which would take it from e
+                clone = Entity(
+                    model=self._copy_model(e.model), texture=e.texture, parent=e.parent,
+                    position=e.position, rotation=e.rotation, scale=e.scale
+                )
+            if type(clone) in self._POOLABLE_TYPES:
+                # Attributes the fresh clone has; anything public added later is removed when it's recycled
+                clone._pool_base_keys = frozenset(k for k in vars(clone) if not k.startswith('_'))
+        # Only clones made here may be recycled into the pool (see recycle)
+        clone._duplicator_clone = True
+        # Store the original parent to reparent later
+        clone.original_parent = e.parent
+        # Copy over display and shader attributes
+        clone.color = e.color
+        clone.shader = e.shader
+        clone.origin = e.origin
+        clone.selectable = True
+        # Copy shader inputs individually, with the setter bound once
+        set_shader_input = clone.set_shader_input
+        for shader_key, shader_val in e._shader_inputs.items():
+            set_shader_input(shader_key, shader_val)
+        # Disable collision on the clone and copy collider type
+        clone.collision = False
+        clone.collider_type = e.collider_type
+        return clone
+
+    @staticmethod
+    def _reparent_keep_transform(entities, new_parent):
+        """
+        Reparent `entities` to `new_parent` while keeping their world transforms, like setting `world_parent`
+        on each of them, but inverting the new parent's world transform only once for the whole batch.
+
+        Args:
+            entities (iterable of Entity): The entities to reparent.
+            new_parent (Entity): The new parent.
+
+        Error handling:
+        - If the batched transform math fails (e.g. a node without a transform), falls back to `world_parent`
+          for each entity, logging entities that can't be reparented at all.
+        """
+        entities = list(entities)
+        try:
+            # Local transforms relative to the new parent: inverse(parent world) * entity world.
+            # Computed for all entities before any of them is moved.
+            parent_transform = new_parent.getNetTransform()
+            local_transforms = [parent_transform.invertCompose(e.getNetTransform()) for e in entities]
+        except Exception as exc:
+            print(f"[Duplicator] Batched reparenting failed, reparenting one by one: {exc}")
+            for e in entities:
+                try:
+                    e.world_parent = new_parent
+                except Exception as ent_e:
+                    print(f"[Duplicator] Error reparenting clone {e} to {new_parent}: {ent_e}")
+            return
+
+        for e, local_transform in zip(entities, local_transforms):
+            e.parent = new_parent
+            e.setTransform(local_transform)
+
+    def _set_axis_lock(self, axis_lock):
+        """
+        Set `self.axis_lock` and precompute how it constrains the dragger, so update can apply it as
+        `world_point * self._lock_mask + self._lock_offset` without branching on the axis. Also shows the axis lock
+        gizmo, styled for the locked axis, or hides it when unlocking.
+
+        Args:
+            axis_lock (int or None): 0 to move along X only (Z fixed to the drag start), 2 to move along Z only
+                (X fixed to the drag start), 1 or None for no constraint on the plane.
+        """
+        self.axis_lock = axis_lock
+        gizmo = self.axis_lock_gizmo
+        if gizmo is not None:
+            if axis_lock is not None:
+                # Restyle the gizmo for the locked axis
+                gizmo.scale, gizmo.color = self._AXIS_LOCK_GIZMO_STYLES[axis_lock]
+            # Show the gizmo only while an axis is locked, touching `enabled` only when it actually changes
+            show_gizmo = axis_lock is not None
+            if gizmo.enabled != show_gizmo:
+                gizmo.enabled = show_gizmo
+        if axis_lock == 0:
+            self._lock_mask = Vec3(1, 1, 0)
+            self._lock_offset = Vec3(0, 0, self.start_position.z)
+        elif axis_lock == 2:
+            self._lock_mask = Vec3(0, 1, 1)
+            self._lock_offset = Vec3(self.start_position.x, 0, 0)
+        else:
+            self._lock_mask = Vec3(1, 1, 1)
+            self._lock_offset = Vec3(0, 0, 0)
 
     def update(self):
         """
         Called every frame by the engine.
 
-        - If the plane is enabled (we are currently dragging clones) and there is a valid mouse world point:
+        - If the plane is enabled (we are currently dragging clones), about `update_interval` seconds passed
+          since the last update, and there is a valid mouse world point:
             - Move the dragger to the current mouse world point.
-            - If an axis lock is active, enable and position the corresponding axis gizmo,
-              and constrain the dragger's movement along the locked axis.
+            - If an axis lock is active, constrain the dragger's movement along the locked axis.
 
         Error handling:
-        - Wraps all references to mouse.world_point and gizmos in try-except so unexpected issues do not crash the update loop.
+        - The whole body is guarded by a single try-except so unexpected issues do not crash the update loop.
         """
         try:
-            # Only proceed if the plane is active and we have a valid world point under the mouse cursor
-            if self.plane and self.plane.enabled and mouse.world_point:
-                self.dragger.position = mouse.world_point
-                # If an axis is locked, constrain movement and show the appropriate gizmo
-                if self.axis_lock is not None:
-                    # Enable only the locked axis gizmo
-                    try:
-                        self.axis_lock_gizmos[self.axis_lock].enabled = True
-                    except Exception as e:
-                        print(f"[Duplicator] Error enabling axis gizmo: {e}")
-                    # Lock movement along X (axis_lock == 0)
-                    if self.axis_lock == 0:
-                        try:
-                            self.dragger.z = self.start_position.z
-                        except Exception as e:
-                            print(f"[Duplicator] Error locking Z position: {e}")
-                    # Lock movement along Z (axis_lock == 2)
-                    if self.axis_lock == 2:
-                        try:
-                            self.dragger.x = self.start_position.x
-                        except Exception as e:
-                            print(f"[Duplicator] Error locking X position: {e}")
+            # Only proceed if the plane is active and we have a valid world point under the mouse cursor.
+            # mouse.world_point is read once per frame, and only while dragging.
+            plane = self.plane
+            if not (plane and plane.enabled):
+                return
+            # Move the dragger at most every `update_interval` seconds, however high the frame rate is.
+            # 10% slack so frames arriving slightly early on a display at the cap rate aren't skipped.
+            now = perf_counter()
+            if now - self._last_update_time < self.update_interval * 0.9:
+                return
+            self._last_update_time = now
+            world_point = mouse.world_point
+            if not world_point:
+                return
+            # Move the dragger to the mouse point, constrained by the axis lock (see _set_axis_lock, which also
+            # shows/hides the axis lock gizmo when the lock changes)
+            self.dragger.position = world_point * self._lock_mask + self._lock_offset
         except Exception as e:
-            print(f"[Duplicator] Error in update(): {e}")
+            _report_update_error('[Duplicator]', 'Error in update()', e)
 
     def input(self, key):
         """
         Handles input events.
 
-        - Listens for 'shift+d' combined key to begin duplication of selected entities:
-            - Duplicates each selected entity via deepcopy, copies over important attributes, disables collision,
-              and stores them in self.clones.
+        - Listens for 'shift+d' combined key to begin duplication of selected entities (unless clones are still being placed):
+            - Duplicates each selected entity with `_clone_entity` (the class's own `__deepcopy__`, or the recipe), which copies over
+              important attributes and disables collision, and stores them in self.clones.
             - Adds clones to LEVEL_EDITOR.entities and updates LEVEL_EDITOR.selection.
-            - Records an undo action for 'delete entities' with indices and representations of clones.
             - Activates the plane for dragging, sets up the dragger at the mouse position, and parents clones to the dragger.
         - While the plane is active:
             - On 'left mouse up' event: finalize duplication, reparent clones back to their original parents,
-              disable plane and dragger, clear clones, reset mouse traversal, hide axis gizmos, and re-render selection.
+              disable plane and dragger, clear clones, reset mouse traversal, hide axis gizmos, record an undo action
+              for 'delete entities' with the indices and representations of the clones, and re-render selection.
             - On 'middle mouse down' event: toggle axis lock based on the direction of the drag so far.
 
         Args:
@@ -5029,101 +5812,103 @@ class Duplicator(Entity):
             print(f"[Duplicator] Error getting combined key: {e}")
             return
 
-        # Start duplication when Shift+D is pressed and there is a selection
+        # Start duplication when Shift+D is pressed and there is a selection.
+        # The editor is looked up once and used through a local below.
         try:
-            selection = LEVEL_EDITOR.selection  # type: ignore
+            level_editor = LEVEL_EDITOR  # type: ignore
+            selection = level_editor.selection
         except Exception as e:
             print(f"[Duplicator] Could not access LEVEL_EDITOR.selection: {e}")
-            selection = []
-
-        # Begin duplication process
-        if combined_key == 'shift+d' and selection:
-            try:
-                # Close any open menus
-                LEVEL_EDITOR.menu_handler.state = 'None'  # type: ignore
-            except Exception as e:
-                print(f"[Duplicator] Error closing menu: {e}")
-
-            # Create an empty list to hold clones
-            self.clones = []
-
-            # Duplicate each selected entity
-            for e in selection:
+            level_editor, selection = None, []
+
+        # Begin duplication process. Ignored while the previous clones are still being placed, so their
+        # pending undo record (committed on 'left mouse up') isn't overwritten.
+        if combined_key == 'shift+d' and selection and not (self.plane and self.plane.enabled):
+            # Create the drag plane, dragger and gizmos on the first duplication
+            self._ensure_built()
+
+            # Close any open menus
+            _close_menu('Duplicator')
+
+            # Duplicate each selected entity. Each entity's recipe is formatted once and used both to create
+            # the clone and as the clone's representation in the undo record.
+            recipes = [repr(e) for e in selection]
+            if level_editor.debug:
+                for recipe in recipes:
+                    print(recipe)
+            clones = self.clones = []
+            clone_recipes = []
+            clone_entity = self._clone_entity
+            # One try block covers the whole loop; if an entity fails, it's logged and the loop resumes after it
+            i, count = 0, len(recipes)
+            while i < count:
                 try:
-                    print(repr(e))
-                    clone = deepcopy(e)
-                    # Store the original parent to reparent later
-                    clone.original_parent = e.parent
-                    # Copy over display and shader attributes
-                    clone.color = e.color
-                    clone.shader = e.shader
-                    clone.origin = e.origin
-                    clone.selectable = True
-                    # Copy shader inputs individually
-                    for shader_key, shader_val in e._shader_inputs.items():
-                        clone.set_shader_input(shader_key, shader_val)
-                    # Disable collision on the clone and copy collider type
-                    clone.collision = False
-                    clone.collider_type = e.collider_type
-                    self.clones.append(clone)
+                    for i in range(i, count):
+                        clones.append(clone_entity(selection[i], recipes[i]))
+                        clone_recipes.append(recipes[i])
+                    break
                 except Exception as clone_e:
-                    print(f"[Duplicator] Error duplicating entity {e}: {clone_e}")
+                    print(f"[Duplicator] Error duplicating entity {i} ({selection[i]}): {clone_e}")
+                    i += 1
 
-            # Add clones to the editor's entity list and select them
+            # Add clones to the editor's entity list and select them.
+            # They're appended contiguously, so their indices are the range starting at the old length.
+            first_clone_index = None
             try:
-                LEVEL_EDITOR.entities.extend(self.clones)  # type: ignore
-                LEVEL_EDITOR.selection = self.clones  # type: ignore
+                entities = level_editor.entities
+                first_clone_index = len(entities)
+                entities.extend(clones)
+                # A copy, so the selection isn't the same list object as the Duplicator's working list
+                level_editor.selection = clones.copy()
             except Exception as e:
                 print(f"[Duplicator] Error adding clones to LEVEL_EDITOR: {e}")
 
-            # Record an undo action to delete the newly created entities if undone
-            try:
-                indices = [LEVEL_EDITOR.entities.index(en) for en in self.clones]  # type: ignore
-                representations = [repr(en) for en in self.clones]
-                LEVEL_EDITOR.current_scene.undo.record_undo(  # type: ignore
-                    ('delete entities', indices, representations)
-                )  # type: ignore
-            except Exception as e:
-                print(f"[Duplicator] Error recording undo for clones: {e}")
+            # The undo action that deletes the new entities is recorded once the clones are placed
+            self._pending_undo = (first_clone_index, clones, clone_recipes)
 
+            plane, dragger = self.plane, self.dragger
             # Prepare the plane and dragger for positioning the clones
             try:
                 # Use the last clone's position as a reference point
-                self.clone_from_position = self.clones[-1].position
+                self.clone_from_position = clones[-1].position
                 # Position the plane at the same Y level as the clone to ensure the dragger is on the same plane
-                self.plane.y = LEVEL_EDITOR.selection[-1].world_y  # type: ignore
-                self.plane.enabled = True
+                plane.y = level_editor.selection[-1].world_y
+                plane.enabled = True
             except Exception as e:
                 print(f"[Duplicator] Error activating plane for dragging: {e}")
 
             try:
                 # Direct mouse raycasts to the plane so we can pick a point on it
-                mouse.traverse_target = self.plane
+                mouse.traverse_target = plane
                 mouse.update()
-                self.start_position = mouse.world_point
+                start_position = self.start_position = mouse.world_point
                 # Move the dragger to the starting world point and enable it
-                self.dragger.world_position = self.start_position
-                self.dragger.enabled = True
+                dragger.world_position = start_position
+                dragger.enabled = True
                 # Reset axis lock
-                self.axis_lock = None
+                self._set_axis_lock(None)
             except Exception as e:
                 print(f"[Duplicator] Error setting up dragger: {e}")
 
             # Parent all clones to the dragger, so they follow the dragger's movement
-            for e in LEVEL_EDITOR.selection:  # type: ignore
-                try:
-                    e.world_parent = self.dragger
-                except Exception as e:
-                    print(f"[Duplicator] Error parenting clone {e} to dragger: {e}")
+            self._reparent_keep_transform(level_editor.selection, dragger)
 
         # Finalize duplication on left mouse release once the plane is active
         elif self.plane and self.plane.enabled and key == 'left mouse up':
-            # Reparent clones back to their original parents
+            # update() is throttled, so move the dragger to the release point before the clones leave it
+            try:
+                world_point = mouse.world_point
+                if world_point:
+                    self.dragger.position = world_point * self._lock_mask + self._lock_offset
+            except Exception as e:
+                print(f"[Duplicator] Error moving dragger to the release point: {e}")
+
+            # Reparent clones back to their original parents, one batch per parent
+            clones_by_parent = {}
             for e in getattr(self, 'clones', []):
-                try:
-                    e.world_parent = e.original_parent
-                except Exception as e:
-                    print(f"[Duplicator] Error reparenting clone {e}: {e}")
+                clones_by_parent.setdefault(e.original_parent, []).append(e)
+            for original_parent, clones in clones_by_parent.items():
+                self._reparent_keep_transform(clones, original_parent)
 
             # Disable plane and dragger
             try:
@@ -5139,16 +5924,43 @@ class Duplicator(Entity):
             except Exception as e:
                 print(f"[Duplicator] Error resetting mouse traverse target: {e}")
 
-            # Hide all axis lock gizmos
+            # Hide the axis lock gizmo
             try:
-                for gizmo in self.axis_lock_gizmos:
-                    gizmo.disable()
+                if self.axis_lock_gizmo is not None:
+                    self.axis_lock_gizmo.disable()
             except Exception as e:
-                print(f"[Duplicator] Error disabling axis lock gizmos: {e}")
+                print(f"[Duplicator] Error disabling axis lock gizmo: {e}")
+
+            # Record an undo action to delete the newly created entities if undone
+            if self._pending_undo is not None:
+                first_clone_index, clones, clone_recipes = self._pending_undo
+                self._pending_undo = None
+                try:
+                    entities = level_editor.entities
+                    clone_count = len(clones)
+                    end = first_clone_index + clone_count
+                    placed = entities[first_clone_index:end]
+                    if len(placed) == clone_count and all(e is c for e, c in zip(placed, clones)):
+                        # A range instead of a list of ints: the clones' indices are contiguous, and the undo
+                        # code only iterates and zips them, so the undo history doesn't store one int per clone
+                        indices = range(first_clone_index, end)
+                    else:
+                        # Undo/redo while placing moved the entities, look the clones up again
+                        entity_indices = level_editor.get_entity_indices()
+                        kept = [
+                            (entity_indices[id(c)], r) for c, r in zip(clones, clone_recipes) if id(c) in entity_indices
+                        ]
+                        indices = [i for i, _ in kept]
+                        clone_recipes = [r for _, r in kept]
+                    level_editor.current_scene.undo.record_undo(
+                        ('delete entities', indices, clone_recipes)
+                    )
+                except Exception as e:
+                    print(f"[Duplicator] Error recording undo for clones: {e}")
 
             # Re-render the selection highlight in the editor
             try:
-                LEVEL_EDITOR.render_selection()  # type: ignore
+                level_editor.render_selection()
             except Exception as e:
                 print(f"[Duplicator] Error re-rendering selection: {e}")
 
@@ -5157,19 +5969,24 @@ class Duplicator(Entity):
             try:
                 if self.axis_lock is None:
                     # Calculate absolute delta since drag start in each axis
-                    dx = abs(self.dragger.x - self.start_position.x)
-                    dy = abs(self.dragger.y - self.start_position.y)
-                    dz = abs(self.dragger.z - self.start_position.z)
-                    delta_position = (dx, dy, dz)
-                    max_val = max(delta_position)
-                    # Lock to the axis with the greatest movement
-                    self.axis_lock = delta_position.index(max_val)
-                    # Move gizmos to the world position of the last clone for visibility
-                    for gizmo in self.axis_lock_gizmos:
-                        gizmo.world_position = self.clones[-1].world_position
+                    dragger, start_position = self.dragger, self.start_position
+                    dx = abs(dragger.x - start_position.x)
+                    dy = abs(dragger.y - start_position.y)
+                    dz = abs(dragger.z - start_position.z)
+                    # Lock to the axis with the greatest movement (ties go to the lower axis)
+                    self._set_axis_lock(0 if dx >= dy and dx >= dz else (1 if dy >= dz else 2))
+                    # Move the gizmo to the last clone for visibility. While dragging, both are children of the
+                    # dragger, so copying the local position avoids converting through world space.
+                    gizmo = self.axis_lock_gizmo
+                    if gizmo is not None:
+                        last_clone = self.clones[-1]
+                        if last_clone.parent is gizmo.parent:
+                            gizmo.position = last_clone.position
+                        else:
+                            gizmo.world_position = last_clone.world_position
                 else:
                     # Unlock if already locked
-                    self.axis_lock = None
+                    self._set_axis_lock(None)
             except Exception as e:
                 print(f"[Duplicator] Error toggling axis lock: {e}")
 
@@ -5181,6 +5998,9 @@ class SunHandler(Entity):
     and orients the light to a default direction.
     """
 
+    # The attributes set in __init__, stored in slots instead of the instance __dict__
+    __slots__ = ('sun',)
+
     def __init__(self, **kwargs):
         """
         Initializes the SunHandler instance.
@@ -5277,6 +6097,9 @@ class RightClickMenu(Entity):
     and the hovered entity is part of the current selection.
     """
 
+    # The attributes set in __init__, stored in slots instead of the instance __dict__
+    __slots__ = ('radial_menu', 'start_click_pos')
+
     def __init__(self):
         """
         Initializes the RightClickMenu instance.
@@ -5414,11 +6237,14 @@ class RightClickMenu(Entity):
                 # 2. Mouse movement since right-down is minimal (i.e., a click, not a drag)
                 # 3. The hovered entity is part of the current selection
                 selection_exists = bool(LEVEL_EDITOR.selection)  # type: ignore
-                movement_delta = mouse.position - self.start_click_pos
-                moved_distance = sum(abs(e) for e in movement_delta)
+                # Squared screen distance moved, compared against the squared threshold (no abs/sqrt needed)
+                mouse_position = mouse.position
+                dx = mouse_position[0] - self.start_click_pos[0]
+                dy = mouse_position[1] - self.start_click_pos[1]
+                moved_distance_sq = dx * dx + dy * dy
                 hovered_entity = LEVEL_EDITOR.selector.get_hovered_entity()  # type: ignore
 
-                if selection_exists and moved_distance < .005 and hovered_entity in LEVEL_EDITOR.selection:  # type: ignore
+                if selection_exists and moved_distance_sq < .005 * .005 and hovered_entity in LEVEL_EDITOR.selection:  # type: ignore
                     if self.radial_menu:
                         self.radial_menu.enabled = True
             except Exception as e:
@@ -5437,6 +6263,9 @@ class Search(Entity):
         input_field (InputField): The text input field that is shown or hidden based on user input.
     """
 
+    # The attributes set in __init__, stored in slots instead of the instance __dict__
+    __slots__ = ('input_field',)
+
     def __init__(self, **kwargs):
         """
         Initializes the Search instance.
@@ -5507,6 +6336,10 @@ class Search(Entity):
         #         print(f"[Search] Error accessing input_field.text: {e}")
 
 
+# (frame number, (x, y, z)) of the last camera.back read by get_major_axis_relative_to_view.
+_CAM_BACK_CACHE = [-1, None]
+
+
 def get_major_axis_relative_to_view(entity):
     """
     Determine which principal axis of an entity (right, up, or forward) is most aligned with the camera's viewing direction.
@@ -5537,19 +6370,31 @@ def get_major_axis_relative_to_view(entity):
           returns (None, False). This ensures the caller can handle missing or invalid data gracefully without crashing.
     """
     try:
-        # Compute the dot product between camera.back and each local axis, rounding to one decimal place.
-        r = round(camera.back.dot(entity.right), 1)
-        u = round(camera.back.dot(entity.up), 1)
-        f = round(camera.back.dot(entity.forward), 1)
-
-        # Put them in a tuple so we can find the index of the maximal absolute value.
-        dir = (r, u, f)
-
-        # Determine which axis has the largest absolute alignment value.
-        axis_index = dir.index(max(dir, key=abs))
+        # camera.back is a computed property; read it at most once per frame and keep its components as floats.
+        frame = ClockObject.getGlobalClock().getFrameCount()
+        if _CAM_BACK_CACHE[0] != frame:
+            back = camera.back
+            _CAM_BACK_CACHE[0], _CAM_BACK_CACHE[1] = frame, (back.x, back.y, back.z)
+        bx, by, bz = _CAM_BACK_CACHE[1]
+
+        # Compute the dot product between camera.back and each local axis as raw floats, rounding to one decimal place.
+        right, up, forward = entity.right, entity.up, entity.forward
+        r = round(bx * right.x + by * right.y + bz * right.z, 1)
+        u = round(bx * up.x + by * up.y + bz * up.z, 1)
+        f = round(bx * forward.x + by * forward.y + bz * forward.z, 1)
+
+        # Pick the axis with the largest absolute alignment value in a single pass.
+        # Ties resolve to the lowest index, matching max(..., key=abs).
+        abs_r, abs_u, abs_f = abs(r), abs(u), abs(f)
+        if abs_r >= abs_u and abs_r >= abs_f:
+            axis_index, value = 0, r
+        elif abs_u >= abs_f:
+            axis_index, value = 1, u
+        else:
+            axis_index, value = 2, f
 
         # Determine if that dot product is positive (axis points toward camera.back).
-        is_positive_direction = dir[axis_index] > 0
+        is_positive_direction = value > 0
 
         return axis_index, is_positive_direction
 
@@ -5625,12 +6470,13 @@ if __name__ == '__main__':
     # Register additional classes for the class_menu so they can be spawned in-editor
     try:
         from ursina.prefabs.first_person_controller import FirstPersonController
-        # Extend the available_classes dictionary with new prefab options
-        level_editor.class_menu.available_classes |= {
-            'WhiteCube': WhiteCube,
-            'EditorCamera': EditorCamera,
-            'FirstPersonController': FirstPersonController
-        }
+        # Extend the available classes with new prefab options
+        for name, cls in (
+            ('WhiteCube', WhiteCube),
+            ('EditorCamera', EditorCamera),
+            ('FirstPersonController', FirstPersonController),
+        ):
+            level_editor.class_menu.register_class(name, cls)
     except Exception as e:
         print(f"[main] Error registering additional classes: {e}")
 
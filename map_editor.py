@@ -1,7 +1,8 @@
 from ursina import *
 from ursina.mesh_importer import *
 from tkinter import simpledialog, messagebox
-import importlib
+import os
+from concurrent.futures import ThreadPoolExecutor
 
 app=Ursina()
 
@@ -16,45 +17,75 @@ def toggle_vis(self:Entity):
         self.wireframe=not self.wireframe
 Entity.toggle_vis=toggle_vis
 
+def _accum(u, d, pu, pd, r, l, x, z, c, v, b, n, shift, alt, ctrl, dt):
+    # pure arithmetic core of DebugBehaviour.update: returns (dx,dy,dz,sx,sy,sz,rx,ry,rz)
+    # held key values are 0/1, so the speed selection is plain arithmetic instead of nested conditionals
+    move = (1 - alt) * (5 - 4 * ctrl) * dt
+    dz, dy, dx = (u - d) * move, (pu - pd) * move, (r - l) * move
+    turn = (20 - 10 * ctrl) * dt
+    rx, ry, rz = (c - v) * turn, (x - z) * turn, (b - n) * turn
+    if shift: return 0, 0, 0, dx, dy, dz, rx, ry, rz
+    return dx, dy, dz, 0, 0, 0, rx, ry, rz
+
+# shared int-indexed keystate, refreshed from held_keys once per input event instead of hashed per entity per frame
+_KEYIDX={'up arrow':0, 'down arrow':1, 'page up':2, 'page down':3, 'right arrow':4, 'left arrow':5,
+         'x':6, 'z':7, 'c':8, 'v':9, 'b':10, 'n':11, 'shift':12, 'alt':13, 'control':14}
+UP, DOWN, PGUP, PGDN, RIGHT, LEFT, KX, KZ, KC, KV, KB, KN, SHIFT, ALT, CTRL = range(len(_KEYIDX))
+_KEYSTATE=[0]*len(_KEYIDX)
+def _sync_keystate(key):
+    for k, i in _KEYIDX.items():
+        _KEYSTATE[i]=held_keys[k]
+_keystate_listener=Entity(input=_sync_keystate, eternal=True)
+
+# per-frame deltas shared by every DebugBehaviour; the poller is created before any object so it updates first
+_FRAME_DELTAS=(0, 0, 0, 0, 0, 0, 0, 0, 0)
+_FRAME_IDLE=True
+def _poll_frame_input():
+    global _FRAME_DELTAS, _FRAME_IDLE
+    ks=_KEYSTATE
+    _FRAME_DELTAS=_accum(
+        ks[UP], ks[DOWN], ks[PGUP], ks[PGDN], ks[RIGHT], ks[LEFT],
+        ks[KX], ks[KZ], ks[KC], ks[KV], ks[KB], ks[KN],
+        ks[SHIFT], ks[ALT], ks[CTRL], time.dt)
+    # nothing to flush to any transform this frame
+    _FRAME_IDLE=not any(_FRAME_DELTAS)
+_frame_input_poller=Entity(update=_poll_frame_input, eternal=True)
+
 class DebugBehaviour():
+    _KEY_TABLE={'up arrow':(2,1), 'down arrow':(2,-1), 'page up':(1,1), 'page down':(1,-1), 'right arrow':(0,1), 'left arrow':(0,-1)}
     def __init__(self) -> None:
-        self.entity:Entity
+        self._entity:Entity
+    @property
+    def entity(self):
+        return self._entity
+    @entity.setter
+    def entity(self, value):
+        # add_script assigns the entity once, so hook up the click toggle here instead of every frame
+        self._entity=value
+        value.on_click=self.toggle
     def update(self):
-        self.entity.on_click=self.toggle
-        if selecting!=self: return
-        if held_keys["shift"]:
-            self.entity.scale_z += (held_keys['up arrow'] - held_keys['down arrow']) * (time.dt * (1 if held_keys['control'] else 5) if not held_keys['alt'] else 0)
-            self.entity.scale_y += (held_keys['page up'] - held_keys['page down']) * (time.dt * (1 if held_keys['control'] else 5) if not held_keys['alt'] else 0)
-            self.entity.scale_x += (held_keys['right arrow'] - held_keys['left arrow']) * (time.dt * (1 if held_keys['control'] else 5) if not held_keys['alt'] else 0)
-        else:
-            self.entity.z += (held_keys['up arrow'] - held_keys['down arrow']) * (time.dt * (1 if held_keys['control'] else 5) if not held_keys['alt'] else 0)
-            self.entity.y += (held_keys['page up'] - held_keys['page down']) * (time.dt * (1 if held_keys['control'] else 5) if not held_keys['alt'] else 0)
-            self.entity.x += (held_keys['right arrow'] - held_keys['left arrow']) * (time.dt * (1 if held_keys['control'] else 5) if not held_keys['alt'] else 0)
-
-        self.entity.rotation_y += (held_keys['x'] - held_keys['z']) * time.dt * (10 if held_keys['control'] else 20)
-        self.entity.rotation_x += (held_keys['c'] - held_keys['v']) * time.dt * (10 if held_keys['control'] else 20)
-        self.entity.rotation_z += (held_keys['b'] - held_keys['n']) * time.dt * (10 if held_keys['control'] else 20)
+        if selecting is not self or _FRAME_IDLE: return
+        dx,dy,dz,sx,sy,sz,rx,ry,rz=_FRAME_DELTAS
+        e=self.entity
+        # only write the transform components that actually change this frame
+        if _KEYSTATE[SHIFT]:
+            if sx or sy or sz: e.scale += Vec3(sx,sy,sz)
+        elif dx or dy or dz: e.position += Vec3(dx,dy,dz)
+        if rx or ry or rz: e.rotation += Vec3(rx,ry,rz)
     def input(self, key):
-        if selecting!=self: return
+        if selecting is not self: return
         if key=='f':
             print(f'\'{self.entity.name}\' pos : {self.entity.position}')
             print(f'\'{self.entity.name}\' rot : {self.entity.rotation}')
-        if held_keys["shift"]:
-            self.entity.scale_z += (int(key=='up arrow') - int(key=='down arrow')) * held_keys['alt']
-            self.entity.scale_y += (int(key=='page up') - int(key=='page down')) * held_keys['alt']
-            self.entity.scale_x += (int(key=='right arrow') - int(key=='left arrow')) * held_keys['alt']
-            if held_keys['alt'] and key != 'alt':
-                self.entity.scale_x=int(self.entity.scale_x)
-                self.entity.scale_y=int(self.entity.scale_y)
-                self.entity.scale_z=int(self.entity.scale_z)
-        else:
-            self.entity.z += (int(key=='up arrow') - int(key=='down arrow')) * held_keys['alt']
-            self.entity.y += (int(key=='page up') - int(key=='page down')) * held_keys['alt']
-            self.entity.x += (int(key=='right arrow') - int(key=='left arrow')) * held_keys['alt']
-            if held_keys['alt'] and key != 'alt':
-                self.entity.x=int(self.entity.x)
-                self.entity.y=int(self.entity.y)
-                self.entity.z=int(self.entity.z)
+        # alt snaps: step along the pressed key's axis, then truncate all three components
+        if not held_keys['alt'] or key=='alt': return
+        target='scale' if held_keys["shift"] else 'position'
+        v=list(getattr(self.entity, target))
+        entry=self._KEY_TABLE.get(key)
+        if entry:
+            axis, sign=entry
+            v[axis]+=sign
+        setattr(self.entity, target, Vec3(int(v[0]), int(v[1]), int(v[2])))
     def toggle(self):
         global selecting
         if deleting:
@@ -91,11 +122,9 @@ def toggleDelete():
 
 def save():
     if messagebox.askyesno("Map Editor", "Do you want to save?"):
-        code=f"from ursina import *\n\n"
-        for i in objects:
-            code+=repr(i)+'\n'
         with open('scene.py', 'w') as file:
-            file.write(code)
+            file.write("from ursina import *\n\n")
+            file.writelines(f"{repr(i)}\n" for i in objects)
 
 OBJECTS_PER_PAGE=5
 
@@ -117,20 +146,37 @@ def refresh_container():
     container_o.clear()
     for i in range(current_page*OBJECTS_PER_PAGE, min((current_page+1)*OBJECTS_PER_PAGE,len(objects))):
         if objects[i]:container_o.append(Button(objects[i].name, position=Vec3(0.6342687, 0.40175405*(1-i/3), -0.90489095), on_click=objects[i].toggle_vis, color=color.white, scale=(.5,.1), text_color=color.black))
+# compiled scene.py, reused until the file's mtime or size changes (mtime alone can be as coarse as 2 s)
+_SCENE_CACHE={'key':None, 'code':None}
+# reading and compiling scene.py runs on this worker so the render thread keeps drawing frames meanwhile
+_LOAD_EXECUTOR=ThreadPoolExecutor(max_workers=1)
+def _compile_scene():
+    st=os.stat('scene.py')
+    key=(st.st_mtime_ns, st.st_size)
+    if key!=_SCENE_CACHE['key']:
+        with open('scene.py') as file:
+            _SCENE_CACHE['code']=compile(file.read(), 'scene.py', 'exec')
+        _SCENE_CACHE['key']=key
+    return _SCENE_CACHE['code']
+def _apply_loaded_scene(future):
+    # entity creation has to happen on the main thread, so poll the compile job once per frame.
+    # invoke() runs immediately when delay is 0, so wait a frame instead of recursing
+    if not future.done():
+        invoke(_apply_loaded_scene, future, delay=1/60)
+        return
+    code=future.result()
+    scene.clear()
+    camera.overlay.color=color.clear
+    exec(code, {})
+    for i in scene.entities:
+        i:Entity
+        if not i.eternal:
+            objects.append(i)
+            i.add_script(DebugBehaviour())
+    refresh_container()
 def load():
     if messagebox.askyesno("Map Editor", "Do you want to load?"):
-        scene.clear()
-        camera.overlay.color=color.clear
-        if 'scene' in sys.modules:
-            importlib.reload(sys.modules['scene'])
-        else:
-            importlib.import_module('scene')
-        for i in scene.entities:
-            i:Entity
-            if not i.eternal:
-                objects.append(i)
-                i.add_script(DebugBehaviour())
-        refresh_container()
+        _apply_loaded_scene(_LOAD_EXECUTOR.submit(_compile_scene))
 Entity(model=Quad(.1, aspect=.7), color=color.black33, parent=camera.ui, scale=(.7,1), x=-0.6479293, eternal=True)
 Button('Add new Object', position=Vec3(-0.61267745, 0.39322376, -0.8950644), color=color.white, on_click=addnew, scale=(.5,.1), text_color=color.black, eternal=True)
 Button('Toggle Delete Mode', position=Vec3(-0.61267745, 0.19322376, -0.8950644), color=color.white, on_click=toggleDelete, scale=(.5,.1), text_color=color.black, eternal=True)
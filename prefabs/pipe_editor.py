@@ -8,19 +8,28 @@ class PipeEditor(Entity):
     Editor Entity for creating and modifying a Pipe in the Ursina Level Editor.
 
     Attributes:
-        _point_gizmos (LoopingList[Entity]): List of gizmo Entities representing control points of the pipe.
+        _point_positions (list[Vec3]): Control point positions, relative to this entity.
+        _point_scales (list[Vec3]): Control point gizmo scales; their xz components are the pipe thickness.
+        _point_gizmos (LoopingList[Entity]): Gizmo Entities for the control points. Only populated while in edit mode.
+        _gizmo_index (dict[int, int]): Maps id() of each point gizmo to its index in `_point_gizmos`.
         model (Pipe): The visual model of the pipe, updated whenever control points change.
         _edit_mode (bool): Flag indicating whether the editor is in point-edit mode.
+        _regen_pending (bool): True while a delayed regeneration is scheduled but has not run yet.
+        _last_shape_key (tuple): Path, thicknesses and collider flag the current model was built from.
+        _path_buf (list[Vec3]), _thickness_buf (list[Vec2]): Reused per-gizmo buffers filled by generate().
         add_collider (bool): Flag indicating whether to add a collider to the pipe model.
     """
 
-    def __init__(self, points=None, **kwargs):
+    def __init__(self, points=None, point_scales=None, add_collider=False, **kwargs):
         """
         Initialize a new PipeEditor.
 
         Args:
             points (list[Vec3], optional): List of Vec3 positions for initial control points.
                 Defaults to two points at (0,0,0) and (0,1,0).
+            point_scales (list[Vec3], optional): Scale of each control point; their xz components are the pipe
+                thickness. Defaults to (1,1,1) for every point.
+            add_collider (bool, optional): Whether to add a collider to the pipe model. Defaults to False.
             **kwargs: Additional keyword arguments passed to the base Entity constructor.
 
         Raises:
@@ -50,27 +59,22 @@ class PipeEditor(Entity):
         # Add this editor to the global entity list so it participates in selection/rendering
         LEVEL_EDITOR.entities.append(self) # type: ignore
 
-        # Create gizmo Entities for each control point, parented to this PipeEditor
-        try:
-            self._point_gizmos = LoopingList([
-                Entity(
-                    parent=self,
-                    original_parent=self,
-                    position=point,
-                    selectable=False,
-                    name='PipeEditor_point',
-                    is_gizmo=True
-                )
-                for point in points
-            ])
-        except Exception as e:
-            # Catch any unexpected errors constructing gizmo entities
-            raise RuntimeError(f"Failed to create point gizmos: {e}") from e
+        # Keep the control points as plain data; gizmo Entities are only created while in edit mode
+        self._point_positions = list(points)
+        self._point_scales = list(point_scales) if point_scales is not None else [Vec3(1, 1, 1) for _ in points]
+        self._point_gizmos = LoopingList()
+
+        # Map gizmo ids to their position in _point_gizmos for O(1) lookups in input()
+        self._reindex_gizmos()
 
         # Initialize the pipe model and state flags
         self.model = None
         self._edit_mode = False
-        self.add_collider = False
+        self.add_collider = add_collider
+        self._regen_pending = False
+        self._last_shape_key = None
+        self._path_buf = []
+        self._thickness_buf = []
 
         # Generate initial geometry
         self.generate()
@@ -80,6 +84,7 @@ class PipeEditor(Entity):
         Generate or update the pipe model based on current control points and their scales.
 
         - Updates `self.model` to a new Pipe with the current path and thicknesses.
+        - Does nothing if the path, thicknesses and collider flag match the last build.
         - Applies a default 'grass' texture.
         - Adds a collider if `self.add_collider` is True.
 
@@ -87,21 +92,39 @@ class PipeEditor(Entity):
             ValueError: If there are fewer than two control points (cannot form a pipe).
             AttributeError: If a gizmo is missing required attributes (position or scale).
         """
-        # Gather positions for the path relative to this entity
-        try:
-            path = [gizmo.get_position(relative_to=self) for gizmo in self._point_gizmos]
-        except Exception as e:
-            raise AttributeError(f"Failed to retrieve gizmo positions: {e}") from e
-
         # Ensure enough points to define a pipe
-        if len(path) < 2:
+        gizmos = self._point_gizmos
+        n = len(gizmos) if gizmos else len(self._point_positions)
+        if n < 2:
             raise ValueError("At least two control points are required to generate a pipe.")
 
-        # Gather thickness values from each gizmo's scale.xz (assuming scale is a Vec3)
+        # Reuse the path/thickness buffers; they are only reallocated when the number of gizmos changes.
+        # The current Pipe keeps a reference to them, which is fine since any change rebuilds it below.
+        if len(self._path_buf) != n:
+            self._path_buf = [None] * n
+            self._thickness_buf = [None] * n
+        path, thicknesses = self._path_buf, self._thickness_buf
+
+        # Fill positions relative to this entity and thicknesses from each gizmo's scale.xz in one pass.
+        # Gizmos parented directly to this entity already store that position locally; only reparented
+        # ones (e.g. while the level editor is dragging them) need the relative transform composed.
+        # Outside edit mode there are no gizmos, and the stored point data is used instead.
         try:
-            thicknesses = [gizmo.scale.xz for gizmo in self._point_gizmos]
+            if gizmos:
+                for i, gizmo in enumerate(gizmos):
+                    path[i] = gizmo.position if gizmo.parent is self else gizmo.get_position(relative_to=self)
+                    thicknesses[i] = gizmo.scale.xz
+            else:
+                for i, (position, scale) in enumerate(zip(self._point_positions, self._point_scales)):
+                    path[i] = position
+                    thicknesses[i] = scale.xz
         except Exception as e:
-            raise AttributeError(f"Failed to retrieve gizmo scale for thickness: {e}") from e
+            raise AttributeError(f"Failed to retrieve gizmo position or scale: {e}") from e
+
+        # Skip the rebuild when neither the control points nor the collider flag changed since the last one
+        shape_key = (tuple(path), tuple(thicknesses), self.add_collider)
+        if self.model is not None and shape_key == self._last_shape_key:
+            return
 
         # Create or replace the existing Pipe model
         try:
@@ -120,27 +143,90 @@ class PipeEditor(Entity):
             except Exception as e:
                 raise RuntimeError(f"Failed to set collider on Pipe: {e}") from e
 
+        # Only remembered once the build succeeded, so a failed one is retried by the next generate()
+        self._last_shape_key = shape_key
+
+    def _reindex_gizmos(self):
+        """
+        Rebuild `_gizmo_index` after `_point_gizmos` has been created or reordered.
+        """
+        self._gizmo_index = {id(gizmo): i for i, gizmo in enumerate(self._point_gizmos)}
+
+    def _build_gizmos(self):
+        """
+        Create a gizmo Entity for each stored control point, parented to this PipeEditor.
+
+        Raises:
+            RuntimeError: If the gizmo entities cannot be created.
+        """
+        try:
+            self._point_gizmos = LoopingList([
+                Entity(
+                    parent=self,
+                    original_parent=self,
+                    position=position,
+                    scale=scale,
+                    selectable=False,
+                    name='PipeEditor_point',
+                    is_gizmo=True
+                )
+                for position, scale in zip(self._point_positions, self._point_scales)
+            ])
+        except Exception as e:
+            # Catch any unexpected errors constructing gizmo entities
+            raise RuntimeError(f"Failed to create point gizmos: {e}") from e
+        self._reindex_gizmos()
+
+    def _sync_points_from_gizmos(self):
+        """
+        Copy the current gizmo positions (relative to this entity) and scales back into the stored point data.
+        """
+        if not self._point_gizmos:
+            return
+        self._point_positions = [
+            gizmo.position if gizmo.parent is self else gizmo.get_position(relative_to=self)
+            for gizmo in self._point_gizmos
+        ]
+        self._point_scales = [gizmo.scale for gizmo in self._point_gizmos]
+
+    def _release_gizmos(self):
+        """
+        Store the gizmos' state back into the point data and destroy the gizmo Entities.
+        """
+        self._sync_points_from_gizmos()
+        for gizmo in self._point_gizmos:
+            destroy(gizmo)
+        self._point_gizmos = LoopingList()
+        self._reindex_gizmos()
+
     def __deepcopy__(self, memo):
         """
-        Create a deep copy of this PipeEditor by evaluating its repr.
+        Create a deep copy of this PipeEditor by constructing a new one from its current state.
 
-        Warning:
-            This implementation relies on repr() returning a valid Python expression.
-            If repr is not overridden appropriately, this may fail.
+        The control point positions, point scales (pipe thickness), transform and collider flag are passed
+        to the constructor directly, instead of evaluating repr(self) and re-running every constructor from
+        parsed source, so the copy's pipe is built only once.
 
         Returns:
             PipeEditor: A new instance duplicating this instance's data.
 
         Raises:
-            NotImplementedError: If repr(self) is not evaluable to recreate the object.
+            RuntimeError: If the copy cannot be constructed from this instance's state.
         """
         try:
-            return eval(repr(self))
+            self._sync_points_from_gizmos()
+            new = PipeEditor(
+                points=[Vec3(*p) for p in self._point_positions],
+                point_scales=[Vec3(*s) for s in self._point_scales],
+                add_collider=self.add_collider,
+                position=self.position,
+                rotation=self.rotation,
+                scale=self.scale,
+            )
+            memo[id(self)] = new
+            return new
         except Exception as e:
-            raise NotImplementedError(
-                "Deep copying via repr(e) failed. "
-                "Ensure __repr__ is implemented to return a valid constructor call."
-            ) from e
+            raise RuntimeError(f"Failed to deep copy PipeEditor: {e}") from e
 
     @property
     def points(self):
@@ -150,7 +236,9 @@ class PipeEditor(Entity):
         Returns:
             list[Vec3]: Positions of all gizmo control points in world space.
         """
-        return [gizmo.position for gizmo in self._point_gizmos]
+        if self._point_gizmos:
+            return [gizmo.position for gizmo in self._point_gizmos]
+        return list(self._point_positions)
 
     @property
     def edit_mode(self):
@@ -168,6 +256,7 @@ class PipeEditor(Entity):
         Enable or disable edit mode.
 
         In edit mode:
+            - Control-point gizmos are created from the stored point data.
             - All other LEVEL_EDITOR entities become non-selectable.
             - This PipeEditor's control-point gizmos are added to LEVEL_EDITOR.entities and become selectable.
 
@@ -175,6 +264,7 @@ class PipeEditor(Entity):
             - Control-point gizmos are removed from LEVEL_EDITOR.entities.
             - All remaining LEVEL_EDITOR.entities become selectable.
             - If any gizmo was selected at the moment of exit, the pipe itself is re-selected.
+            - The gizmos' positions and scales are stored back and the gizmo Entities are destroyed.
 
         Args:
             value (bool): True to enter edit mode; False to exit.
@@ -186,29 +276,37 @@ class PipeEditor(Entity):
         self._edit_mode = value
 
         if value:
+            # Create the gizmos on demand so idle pipes don't keep them in the scene graph
+            if not self._point_gizmos:
+                self._build_gizmos()
+
             # Disable selection on all other entities
             for ent in LEVEL_EDITOR.entities: # type: ignore
                 if ent is not self:
                     setattr(ent, 'selectable', False)
 
-            # Add gizmos to level editor if not already present, then make them selectable
+            # Add gizmos to level editor if not already present, then make them selectable.
+            # Membership is checked against a set of ids built once, instead of scanning the list per gizmo.
+            entity_ids = {id(ent) for ent in LEVEL_EDITOR.entities} # type: ignore
             for gizmo in self._point_gizmos:
-                if gizmo not in LEVEL_EDITOR.entities: # type: ignore
+                if id(gizmo) not in entity_ids:
                     LEVEL_EDITOR.entities.append(gizmo) # type: ignore
+                    entity_ids.add(id(gizmo))
                 setattr(gizmo, 'selectable', True)
         else:
-            # Exiting edit mode: remove each gizmo from level editor and restore selectability
-            for gizmo in list(self._point_gizmos):
-                if gizmo in LEVEL_EDITOR.entities: # type: ignore
-                    LEVEL_EDITOR.entities.remove(gizmo) # type: ignore
+            # Exiting edit mode: remove the gizmos from level editor in a single pass and restore selectability
+            gizmo_ids = {id(gizmo) for gizmo in self._point_gizmos}
+            LEVEL_EDITOR.entities[:] = [ent for ent in LEVEL_EDITOR.entities if id(ent) not in gizmo_ids] # type: ignore
 
             for ent in LEVEL_EDITOR.entities: # type: ignore
                 setattr(ent, 'selectable', True)
 
             # If any gizmo was selected while exiting, re-select the pipe itself
-            if any(gizmo in LEVEL_EDITOR.selection for gizmo in self._point_gizmos): # type: ignore
+            if any(id(ent) in gizmo_ids for ent in LEVEL_EDITOR.selection): # type: ignore
                 LEVEL_EDITOR.selection = [self] # type: ignore
 
+            self._release_gizmos()
+
         # Update visual selection indicators in the level editor
         LEVEL_EDITOR.render_selection() # type: ignore
 
@@ -235,15 +333,16 @@ class PipeEditor(Entity):
 
         # Toggle edit mode on 'tab' press if relevant entity is selected
         if combined_key == 'tab':
-            if self in LEVEL_EDITOR.selection or any(gizmo in LEVEL_EDITOR.selection for gizmo in self._point_gizmos): # type: ignore
+            selected_ids = {id(ent) for ent in LEVEL_EDITOR.selection} # type: ignore
+            if id(self) in selected_ids or any(id(gizmo) in selected_ids for gizmo in self._point_gizmos):
                 self.edit_mode = not self.edit_mode
                 return
 
         # Add a new control point between the selected gizmo and the next one
         if key == '+' and len(LEVEL_EDITOR.selection) == 1: # type: ignore
             selected = LEVEL_EDITOR.selection[0] # type: ignore
-            if selected in self._point_gizmos:
-                idx = self._point_gizmos.index(selected)
+            idx = self._gizmo_index.get(id(selected))
+            if idx is not None:
                 # Ensure there is a "next" gizmo to interpolate with
                 if idx + 1 >= len(self._point_gizmos):
                     raise IndexError("Cannot add a point after the last control point.")
@@ -271,6 +370,7 @@ class PipeEditor(Entity):
                 # Insert into editor lists and update selection rendering
                 LEVEL_EDITOR.entities.append(new_point) # type: ignore
                 self._point_gizmos.insert(idx + 1, new_point)
+                self._reindex_gizmos()
                 LEVEL_EDITOR.render_selection() # type: ignore
 
         # Regenerate the mesh on spacebar press
@@ -283,12 +383,27 @@ class PipeEditor(Entity):
 
         # If in edit mode and any mouse button is released, schedule a regeneration
         elif self.edit_mode and key.endswith(' up'):
+            # Coalesce bursts of releases into a single pending regeneration
+            if self._regen_pending:
+                return
             try:
                 # Delay a few frames to allow gizmo movements to settle
-                invoke(self.generate, delay=3/60)
+                invoke(self._do_regen, delay=3/60)
+                self._regen_pending = True
             except Exception as e:
                 print(f"[PipeEditor] Failed to schedule mesh regeneration: {e}")
 
+    def _do_regen(self):
+        """
+        Run the regeneration scheduled from input() and clear the pending flag,
+        so the next release can schedule another one.
+        """
+        self._regen_pending = False
+        try:
+            self.generate()
+        except Exception as e:
+            print(f"[PipeEditor] Error regenerating pipe: {e}")
+
 
 if __name__ == '__main__':
     """
@@ -1,7 +1,65 @@
+from array import array
 from ursina.editor.level_editor import *
 from ursina.shaders import colored_lights_shader
 from ursina.scripts.property_generator import generate_properties_for_class
 
+# Imported once at module load; generate() reports the failure if tripy is unavailable.
+try:
+    import tripy
+    _TRIPY_IMPORT_ERROR = None
+except ImportError as e:
+    tripy = None
+    _TRIPY_IMPORT_ERROR = e
+
+
+# Entity properties that are applied to the model, and so must be set again once PokeShape has assigned its Mesh.
+_MODEL_DEPENDENT_KEYS = ('origin', 'texture_scale', 'collider')
+
+# Shared flat-up normal; Mesh only reads normals when generating, so one instance can fill the whole list.
+_UP = Vec3(0, 1, 0)
+
+
+def _rewrite_point_vertices(mesh, vertices):
+    """
+    Overwrite the positions of an already generated point Mesh in place, without rebuilding its GPU data.
+
+    Only possible when the mesh holds a single Geom with the same number of rows as `vertices`; the position
+    column is array 0 of ursina's generated vertex format (three float32 per row).
+
+    Args:
+        mesh (Mesh): A Mesh in 'point' mode that has been generated before.
+        vertices (list[Vec3]): New vertex positions.
+
+    Returns:
+        bool: True if the positions were written in place; False if the caller must call mesh.generate().
+    """
+    geom_node = getattr(mesh, 'geomNode', None)
+    if geom_node is None or geom_node.getNumGeoms() != 1:
+        return False
+    vdata = geom_node.modifyGeom(0).modifyVertexData()
+    if vdata.getNumRows() != len(vertices):
+        return False
+    memoryview(vdata.modify_array(0)).cast('B').cast('f')[:] = array('f', [c for v in vertices for c in v])
+    mesh.vertices = vertices
+    return True
+
+
+def _earclip(polygon):
+    """
+    Triangulate a 2D polygon with tripy's ear clipping and return the triangle corners as one flat list.
+
+    The polygon is handed to tripy as plain (x, y) float tuples, so tripy's own point conversion does not
+    have to iterate Panda3D vectors, and the nested triangle tuples are flattened in a single pass.
+
+    Args:
+        polygon (list[tuple[float, float]]): Polygon vertices in order.
+
+    Returns:
+        list[tuple[float, float]]: Three consecutive entries per triangle.
+    """
+    triangles = tripy.earclip(polygon)
+    return [corner for tri in triangles for corner in tri]
+
 
 @generate_properties_for_class()
 class PokeShape(Entity):
@@ -19,11 +77,12 @@ class PokeShape(Entity):
             - texture (str): Default texture for the mesh.
             - texture_scale (Vec2): UV scaling factor for texture mapping.
         gizmo_color (color): Color used for gizmo handles when editing.
+        regenerate_rate (int): Maximum number of mesh regenerations per second while dragging points.
         ready (bool): Indicates whether initial generation is complete.
         _point_gizmos (LoopingList[Entity]): Gizmo entities representing polygon vertices.
         add_new_point_renderer (Entity): Temporary renderer showing potential new point positions.
         add_collider (bool): Whether to add a collider to the mesh.
-        _wall_parent (Entity | None): Parent entity for generated wall mesh, if any.
+        _wall_parent (Entity | None): Parent entity for generated wall mesh. Created on first use and reused afterwards.
         wall_height (float): Height for wall extrusion.
         subdivisions (int): Number of smoothing passes for polygon edges.
         smoothing_distance (float): Interpolation factor for smoothing.
@@ -50,6 +109,7 @@ class PokeShape(Entity):
     )  # combine dicts
 
     gizmo_color = color.violet
+    regenerate_rate = 30  # max mesh regenerations per second while dragging points
 
     def __init__(self, edit_mode=False, **kwargs):
         """
@@ -124,10 +184,19 @@ class PokeShape(Entity):
         except Exception as e:
             raise RuntimeError(f"Failed to create add_new_point_renderer entity: {e}") from e
 
+        # Drag regeneration is coalesced through these flags (see update/_flush)
+        self._dirty = False
+        self._flush_scheduled = False
+
         # Initialize wall-related fields
         self.add_collider = False
         self._wall_parent = None
 
+        # Signatures of the inputs the base and wall meshes were last built from (see generate)
+        self._base_sig = None
+        self._smoothed_polygon = None
+        self._wall_sig = None
+
         # Set wall and smoothing parameters from merged properties
         try:
             self.wall_height = merged['wall_height']
@@ -146,11 +215,10 @@ class PokeShape(Entity):
                 raise TypeError("'points' must be a list of Vec3 instances.")
             self.points = points
 
-        # Apply other Entity default attributes (excluding 'model', which is already set)
-        for key in Entity.default_values.keys():
-            if key == 'model':
-                continue
-            # Only set attributes present in merged if they were part of default_values or kwargs
+        # The base constructor already applied every property in merged. Only the ones that act on the
+        # model are re-applied, since the Mesh was assigned afterwards (color and texture are re-applied
+        # by Entity's model setter itself).
+        for key in _MODEL_DEPENDENT_KEYS:
             if key in merged:
                 try:
                     setattr(self, key, merged[key])
@@ -190,81 +258,105 @@ class PokeShape(Entity):
 
         Steps:
             1. Clean up any deleted gizmo references from _point_gizmos.
-            2. Build a 2D LoopingList of Vec2 from gizmo positions to represent the polygon.
+            2. Build a list of (x, z) float tuples from gizmo positions to represent the polygon.
             3. If subdivisions > 0, apply smoothing by linear interpolation between neighbors.
+               Steps 3-6 are skipped when the polygon and smoothing settings match the previous build.
             4. Triangulate the polygon using ear clipping (tripy.earclip).
             5. Construct 3D vertices (Vec3) from the 2D triangles and assign them to self.model.
             6. Set UVs and normals for the mesh and call generate() on the mesh to upload to GPU.
-            7. If wall_height > 0, build a wall mesh by extruding edges downward and assign to _wall_parent.
+            7. If wall_height > 0, build a wall mesh by extruding edges downward and assign it to the reused
+               _wall_parent; otherwise hide _wall_parent.
             8. If edit_mode is True, compute midpoints of each edge and update add_new_point_renderer vertices.
 
         Raises:
             RuntimeError: If any step of mesh or wall generation fails.
         """
-        try:
-            import tripy
-        except ImportError as e:
-            raise RuntimeError(f"Failed to import tripy for triangulation: {e}") from e
+        if tripy is None:
+            raise RuntimeError(
+                f"Failed to import tripy for triangulation: {_TRIPY_IMPORT_ERROR}"
+            ) from _TRIPY_IMPORT_ERROR
 
         # Step 1: Remove any None references (deleted gizmos) from the list
         self._point_gizmos = LoopingList([e for e in self._point_gizmos if e])
 
-        # Step 2: Build a 2D polygon from gizmo positions (xz-plane)
+        # Step 2: Build a 2D polygon from gizmo positions (xz-plane).
+        # Gizmos parented directly to this shape already hold their position relative to it; only
+        # reparented ones (e.g. while being dragged) need the relative transform composed.
         try:
-            polygon = LoopingList(
-                Vec2(*e.get_position(relative_to=self).xz) for e in self._point_gizmos
-            )
+            polygon = [
+                (pos[0], pos[2]) for pos in (
+                    e.position if e.parent is self else e.get_position(relative_to=self)
+                    for e in self._point_gizmos
+                )
+            ]
         except Exception as e:
             raise RuntimeError(f"Failed to construct 2D polygon from gizmos: {e}") from e
 
-        # Step 3: Apply smoothing subdivisions if requested
-        if self.subdivisions:
+        # Steps 3-6 depend only on the raw polygon and the smoothing settings. If those match the last
+        # build (e.g. the shape, a wall or the camera moved but no point did), reuse the base mesh and the
+        # smoothed polygon instead of re-triangulating.
+        base_sig = (tuple(polygon), self.subdivisions, self.smoothing_distance)
+        if base_sig == self._base_sig:
+            polygon = self._smoothed_polygon
+        else:
+            # Step 3: Apply smoothing subdivisions if requested.
+            # The passes run directly on the polygon's plain (x, y) float tuples.
+            if self.subdivisions:
+                try:
+                    t = self.smoothing_distance
+                    pts = polygon
+                    for _ in range(self.subdivisions):
+                        smooth = []
+                        append = smooth.append
+                        prev_x, prev_y = pts[-1]
+                        n = len(pts)
+                        for i in range(n):
+                            x, y = pts[i]
+                            next_x, next_y = pts[i + 1 - n]
+                            # Interpolate towards previous and next points
+                            append((x + (prev_x - x) * t, y + (prev_y - y) * t))
+                            append((x + (next_x - x) * t, y + (next_y - y) * t))
+                            prev_x, prev_y = x, y
+                        pts = smooth
+                    polygon = pts
+                except Exception as e:
+                    raise RuntimeError(f"Error during smoothing subdivisions: {e}") from e
+
+            # Step 4: Triangulate the polygon using ear clipping
             try:
-                for _ in range(self.subdivisions):
-                    smooth_polygon = LoopingList()
-                    for i, p in enumerate(polygon):
-                        # Interpolate towards previous and next points
-                        smooth_polygon.append(lerp(p, polygon[i - 1], self.smoothing_distance))
-                        smooth_polygon.append(lerp(p, polygon[i + 1], self.smoothing_distance))
-                    polygon = smooth_polygon
+                tri_corners = _earclip(polygon)
             except Exception as e:
-                raise RuntimeError(f"Error during smoothing subdivisions: {e}") from e
+                raise RuntimeError(f"Triangulation (earclip) failed: {e}") from e
 
-        # Step 4: Triangulate the polygon using ear clipping
-        try:
-            triangles = tripy.earclip(polygon)
-        except Exception as e:
-            raise RuntimeError(f"Triangulation (earclip) failed: {e}") from e
+            # Step 5: Build mesh vertices from triangulated 2D data (set y = 0 for flat base)
+            try:
+                # Built in one comprehension and assigned once, rather than appended vertex by vertex
+                self.model.vertices = [Vec3(x, 0, y) for x, y in tri_corners]
+            except Exception as e:
+                raise RuntimeError(f"Failed to construct mesh vertices from triangles: {e}") from e
 
-        # Step 5: Build mesh vertices from triangulated 2D data (set y = 0 for flat base)
-        try:
-            self.model.vertices = []
-            for tri in triangles:
-                for v in tri:
-                    self.model.vertices.append(Vec3(v[0], 0, v[1]))
-        except Exception as e:
-            raise RuntimeError(f"Failed to construct mesh vertices from triangles: {e}") from e
+            # Step 6: Assign UVs and normals, then generate mesh data
+            try:
+                # Simple UV mapping: use xz components for UV, taken straight from the triangulated 2D corners
+                self.model.uvs = tri_corners
+                # Flat upward normals for all vertices
+                self.model.normals = [_UP] * len(self.model.vertices)
+                # Upload vertex/normal/UV data to GPU
+                self.model.generate()
+            except Exception as e:
+                raise RuntimeError(f"Failed to assign UVs/normals or generate mesh: {e}") from e
 
-        # Step 6: Assign UVs and normals, then generate mesh data
-        try:
-            # Simple UV mapping: use xz components for UV
-            self.model.uvs = [Vec2(v[0], v[2]) * 1 for v in self.model.vertices]
-            # Flat upward normals for all vertices
-            self.model.normals = [Vec3(0, 1, 0) for _ in range(len(self.model.vertices))]
-            # Upload vertex/normal/UV data to GPU
-            self.model.generate()
-        except Exception as e:
-            raise RuntimeError(f"Failed to assign UVs/normals or generate mesh: {e}") from e
+            self._base_sig = base_sig
+            self._smoothed_polygon = polygon
 
         # Step 7: Build or update the wall extrusion if wall_height is non-zero
         try:
-            # If an old wall parent exists, destroy it and reset
-            if self._wall_parent:
-                destroy(self._wall_parent)
-                self._wall_parent = None
-
-            if self.wall_height:
-                # Create new parent entity for walls if missing
+            # Keep the wall entity alive between regenerations; just hide it when there are no walls
+            if not self.wall_height:
+                if self._wall_parent:
+                    self._wall_parent.enabled = False
+            else:
+                # Create the parent entity for walls the first time it is needed, then reuse it
                 if not self._wall_parent:
                     self._wall_parent = Entity(
                         parent=self,
@@ -273,49 +365,45 @@ class PokeShape(Entity):
                         add_to_scene_entities=False,
                         shader=colored_lights_shader
                     )
-
-                # Build wall vertices by extruding each edge downward
-                wall_verts = []
-                for i, vert2d in enumerate(polygon):
-                    # Base vertex at y=0
-                    vert = Vec3(vert2d[0], 0, vert2d[1])
-                    # Next vertex for edge
-                    next_vert2d = polygon[i + 1]
-                    next_vert = Vec3(next_vert2d[0], 0, next_vert2d[1])
-
-                    # Two triangles per quad (six vertices) for wall face
-                    wall_verts.extend((
-                        vert,
-                        vert + Vec3(0, -self.wall_height, 0),
-                        next_vert,
-                        next_vert,
-                        vert + Vec3(0, -self.wall_height, 0),
-                        next_vert + Vec3(0, -self.wall_height, 0),
-                    ))
-
-                # Assign vertices to wall mesh and generate normals and data
-                self._wall_parent.model.vertices = wall_verts
-                # Generate normals automatically or skip smoothing
-                self._wall_parent.model.generate_normals(False)
-                self._wall_parent.model.generate()
+                else:
+                    self._wall_parent.enabled = True
+
+                # Rebuild the wall mesh only if the smoothed outline or the height changed since the last build
+                wall_sig = (base_sig, self.wall_height)
+                if wall_sig != self._wall_sig:
+                    # Build wall vertices by extruding each edge downward.
+                    # Top (y=0) and bottom vertices are computed once per polygon point and then paired with
+                    # their successor, instead of being rebuilt for every edge that touches them.
+                    top = [Vec3(v[0], 0, v[1]) for v in polygon]
+                    down = Vec3(0, -self.wall_height, 0)
+                    bottom = [v + down for v in top]
+                    wall_verts = []
+                    extend = wall_verts.extend
+                    for vert, low, next_vert, next_low in zip(top, bottom, top[1:] + top[:1], bottom[1:] + bottom[:1]):
+                        # Two triangles per quad (six vertices) for wall face
+                        extend((vert, low, next_vert, next_vert, low, next_low))
+
+                    # Assign vertices to wall mesh and generate normals and data
+                    self._wall_parent.model.vertices = wall_verts
+                    # Generate normals automatically or skip smoothing
+                    self._wall_parent.model.generate_normals(False)
+                    self._wall_parent.model.generate()
+                    self._wall_sig = wall_sig
         except Exception as e:
             raise RuntimeError(f"Failed to generate or update wall mesh: {e}") from e
 
         # Step 8: If in edit mode, compute midpoints of each edge for potential new points
         if self.edit_mode:
             try:
-                # Clear previous midpoints
-                self.add_new_point_renderer.model.vertices = []
-                for i, e in enumerate(self._point_gizmos):
-                    # Compute midpoint between vertex i and i+1 (wrap-around)
-                    midpoint = lerp(
-                        self._point_gizmos[i].world_position,
-                        self._point_gizmos[i + 1].world_position,
-                        0.5
-                    )
-                    self.add_new_point_renderer.model.vertices.append(midpoint)
-                # Upload new point vertices to GPU
-                self.add_new_point_renderer.model.generate()
+                # Read each gizmo's world position once, then pair it with its successor (wrap-around)
+                world = [e.world_position for e in self._point_gizmos]
+                midpoints = [(a + b) * 0.5 for a, b in zip(world, world[1:] + world[:1])]
+                # Write the positions into the existing vertex data when the point count is unchanged;
+                # otherwise assign them and upload new point vertices to GPU
+                point_mesh = self.add_new_point_renderer.model
+                if not _rewrite_point_vertices(point_mesh, midpoints):
+                    point_mesh.vertices = midpoints
+                    point_mesh.generate()
             except Exception as e:
                 raise RuntimeError(f"Failed to update add_new_point_renderer vertices: {e}") from e
 
@@ -356,8 +444,8 @@ class PokeShape(Entity):
         """
         Setter for the 'points' property.
 
-        - Destroys existing gizmo entities.
-        - Creates new gizmos at specified positions.
+        - Moves existing gizmo entities to the new positions, reusing as many as possible.
+        - Destroys surplus gizmos, or creates new ones for extra positions.
         - Registers gizmos with LEVEL_EDITOR.entities for selection.
 
         Args:
@@ -371,15 +459,23 @@ class PokeShape(Entity):
         if not isinstance(value, list) or not all(isinstance(p, Vec3) for p in value):
             raise TypeError("'points' must be set to a list of Vec3 instances.")
 
-        # Destroy existing gizmo entities
+        # Diff against the current gizmos instead of rebuilding them all: reuse the common prefix in place
+        existing = [e for e in self._point_gizmos if e]
+        kept = existing[:len(value)]
+        surplus = existing[len(value):]
+        for gizmo, position in zip(kept, value):
+            gizmo.position = position
+
+        # Destroy gizmos beyond the new point count
         try:
-            [destroy(e) for e in self._point_gizmos]
+            for e in surplus:
+                destroy(e)
         except Exception as e:
             raise RuntimeError(f"Failed to destroy existing gizmo entities: {e}") from e
 
-        # Create new gizmo entities for each provided position
+        # Create new gizmo entities for each additional position
         try:
-            self._point_gizmos = LoopingList([
+            added = [
                 Entity(
                     parent=self,
                     original_parent=self,
@@ -388,14 +484,19 @@ class PokeShape(Entity):
                     name='PokeShape_point',
                     is_gizmo=True,
                     enabled=False
-                ) for e in value
-            ])
+                ) for e in value[len(kept):]
+            ]
         except Exception as e:
             raise RuntimeError(f"Failed to create new gizmo entities: {e}") from e
+        self._point_gizmos = LoopingList(kept + added)
 
-        # Register each new gizmo with the level editor so they appear in the scene
+        # Register the gizmos with the level editor so they appear in the scene, dropping destroyed ones
         try:
-            LEVEL_EDITOR.entities.extend(self._point_gizmos) # type: ignore
+            if surplus:
+                surplus_ids = {id(e) for e in surplus}
+                LEVEL_EDITOR.entities[:] = [e for e in LEVEL_EDITOR.entities if id(e) not in surplus_ids] # type: ignore
+            ent_ids = {id(e) for e in LEVEL_EDITOR.entities} # type: ignore
+            LEVEL_EDITOR.entities.extend([g for g in self._point_gizmos if id(g) not in ent_ids]) # type: ignore
         except Exception as e:
             raise RuntimeError(f"Failed to register gizmos with LEVEL_EDITOR: {e}") from e
 
@@ -449,10 +550,11 @@ class PokeShape(Entity):
                 if e is not self:
                     setattr(e, 'selectable', False)
 
-            # Add each gizmo to LEVEL_EDITOR.entities if not already present, and make selectable
+            # Add each gizmo to LEVEL_EDITOR.entities if not already present, and make selectable.
+            # Membership is tested against a set of ids built once instead of scanning the list per gizmo.
+            ent_ids = {id(e) for e in LEVEL_EDITOR.entities} # type: ignore
+            LEVEL_EDITOR.entities.extend([g for g in self._point_gizmos if id(g) not in ent_ids]) # type: ignore
             for gizmo in self._point_gizmos:
-                if gizmo not in LEVEL_EDITOR.entities: # type: ignore
-                    LEVEL_EDITOR.entities.append(gizmo) # type: ignore
                 setattr(gizmo, 'selectable', True)
 
             # Disable Y-axis on the global gizmo to restrict dragging to XZ plane
@@ -470,17 +572,16 @@ class PokeShape(Entity):
             self.collider = None
         else:
             # Exiting edit mode
-            # Remove each gizmo from LEVEL_EDITOR.entities
-            for gizmo in list(self._point_gizmos):
-                if gizmo in LEVEL_EDITOR.entities: # type: ignore
-                    LEVEL_EDITOR.entities.remove(gizmo) # type: ignore
+            # Remove the gizmos from LEVEL_EDITOR.entities in a single filtering pass
+            gizmo_ids = {id(gizmo) for gizmo in self._point_gizmos}
+            LEVEL_EDITOR.entities[:] = [e for e in LEVEL_EDITOR.entities if id(e) not in gizmo_ids] # type: ignore
 
             # Restore selection on all remaining entities
             for e in LEVEL_EDITOR.entities: # type: ignore
                 setattr(e, 'selectable', True)
 
             # If any gizmo was selected at exit, reselect the PokeShape itself
-            if any(gizmo in LEVEL_EDITOR.selection for gizmo in self._point_gizmos): # type: ignore
+            if any(id(e) in gizmo_ids for e in LEVEL_EDITOR.selection): # type: ignore
                 LEVEL_EDITOR.selection = [self] # type: ignore
 
             # Re-enable Y-axis on the global gizmo
@@ -506,20 +607,42 @@ class PokeShape(Entity):
     def update(self):
         """
         Called every frame. If in edit mode and the left mouse is held or 'd' is pressed,
-        re-render selection outlines and regenerate mesh (to reflect gizmo movement).
+        re-render selection outlines and mark the mesh dirty (to reflect gizmo movement).
+
+        Regeneration is coalesced: at most one pending `_flush` is scheduled at a time, so the mesh is
+        rebuilt at up to `regenerate_rate` Hz while dragging instead of on every frame.
 
         Raises:
-            RuntimeError: If generation fails during update.
+            RuntimeError: If scheduling the regeneration fails during update.
         """
         if self.edit_mode:
             try:
                 # Re-highlight selected entities
                 if mouse.left or held_keys['d']:
                     LEVEL_EDITOR.render_selection() # type: ignore
-                    self.generate()
+                    self._dirty = True
+                    if not self._flush_scheduled:
+                        self._flush_scheduled = True
+                        invoke(self._flush, delay=1 / self.regenerate_rate)
             except Exception as e:
                 raise RuntimeError(f"Update regeneration failed: {e}") from e
 
+    def _flush(self):
+        """
+        Run a regeneration scheduled by `update` if the shape was marked dirty, then clear both flags.
+
+        Raises:
+            RuntimeError: If generation fails.
+        """
+        self._flush_scheduled = False
+        if not self._dirty:
+            return
+        self._dirty = False
+        try:
+            self.generate()
+        except Exception as e:
+            raise RuntimeError(f"Update regeneration failed: {e}") from e
+
     def input(self, key):
         """
         Handle input events when this PokeShape or its gizmos are active in the editor.
@@ -551,7 +674,8 @@ class PokeShape(Entity):
                 self.edit_mode = False
 
             # If this shape or any gizmo is selected, toggle edit mode
-            if self in LEVEL_EDITOR.selection or any(g in LEVEL_EDITOR.selection for g in self._point_gizmos): # type: ignore
+            sel_ids = {id(e) for e in LEVEL_EDITOR.selection} # type: ignore
+            if id(self) in sel_ids or any(id(g) in sel_ids for g in self._point_gizmos):
                 self.edit_mode = not self.edit_mode
 
         # In edit mode, handle adding new points via left-click or 'd' key
@@ -565,28 +689,23 @@ class PokeShape(Entity):
                 pass
 
             try:
-                # Compute screen-space distances from mouse to each midpoint vertex
-                points_in_range = [
-                    (distance_2d(world_position_to_screen_position(v), mouse.position), v)
-                    for v in self.add_new_point_renderer.model.vertices
-                ]
-                # Filter to only those within a small threshold
-                points_in_range = [e for e in points_in_range if e[0] < 0.075 / 2]
-                # Sort by distance ascending
-                points_in_range.sort()
+                # Find the midpoint vertex closest to the mouse in screen space, within a small threshold.
+                # A single pass over squared distances replaces computing, filtering and sorting sqrt distances.
+                mouse_x, mouse_y = mouse.position[0], mouse.position[1]
+                # Midpoint i lies on the edge between gizmos i and i+1, so keep the index rather than the vertex
+                i = None
+                closest_d2 = (0.075 / 2) ** 2
+                for index, v in enumerate(self.add_new_point_renderer.model.vertices):
+                    screen_pos = world_position_to_screen_position(v)
+                    dx, dy = screen_pos[0] - mouse_x, screen_pos[1] - mouse_y
+                    d2 = dx * dx + dy * dy
+                    if d2 < closest_d2:
+                        i, closest_d2 = index, d2
             except Exception:
                 # If computation fails or there are no midpoints, do nothing
                 return
 
-            if not points_in_range:
-                return
-
-            # The closest midpoint to the mouse
-            _, closest_point = points_in_range[0]
-            try:
-                i = self.add_new_point_renderer.model.vertices.index(closest_point)
-            except ValueError:
-                # If the point is not found, abort
+            if i is None:
                 return
 
             # Create a new gizmo entity at the midpoint between vertices i and i+1
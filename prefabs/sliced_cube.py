@@ -1,9 +1,14 @@
 from ursina.editor.level_editor import *
+from array import array
 from pathlib import Path
-from copy import deepcopy
+from math import isclose
+from contextlib import contextmanager
+import logging
 
+log = logging.getLogger(__name__)
 
-def stretch_model(mesh, scale, limit=0.25, scale_multiplier=1, regenerate=False):
+
+def stretch_model(mesh, scale, limit=0.25, scale_multiplier=1, regenerate=False, src_vertices=None, src_uvs=None):
     """
     Adjusts the vertices and UVs of a mesh to 'stretch' it based on a given scale vector.
 
@@ -23,6 +28,10 @@ def stretch_model(mesh, scale, limit=0.25, scale_multiplier=1, regenerate=False)
         scale_multiplier (float, optional): Multiplier applied when shifting vertices. Defaults to 1.
         regenerate (bool, optional): If True, calls `mesh.generate()` at the end to re-upload data.
                                      Defaults to False.
+        src_vertices (Sequence, optional): Unstretched vertices to read instead of `mesh.vertices`.
+                                           Lets the caller stretch straight from a base mesh in one pass,
+                                           without first resetting `mesh`. Defaults to None.
+        src_uvs (Sequence, optional): Unstretched uvs to read instead of `mesh.uvs`. Defaults to None.
 
     Raises:
         AttributeError: If `mesh` does not have expected `vertices` or `uvs` attributes.
@@ -41,82 +50,245 @@ def stretch_model(mesh, scale, limit=0.25, scale_multiplier=1, regenerate=False)
         # If scale is not a Vec3 or lacks x,y,z, re-raise as ValueError
         raise ValueError("Scale must be a Vec3 with non-zero x, y, and z components.")
 
-    # Copy original vertices into Vec3 list for manipulation
+    # One handler for the whole pipeline; the chained exception carries the failing step
     try:
-        verts = [Vec3(*e) for e in mesh.vertices]
+        # The source vertices and uvs are only read, so they are not wrapped in fresh Vec3/Vec2 objects first.
+        # A new UV is created only for vertices whose U coordinate actually moves.
+        if src_vertices is None:
+            src_vertices = mesh.vertices
+        verts = []
+        uvs = list(mesh.uvs if src_uvs is None else src_uvs)
+
+        # Iterate over each vertex and adjust based on limit and scale.
+        # Components are worked on as plain floats and each vertex is written out once, instead of
+        # indexing into the Vec3/Vec2 objects for every read and write.
+        sx, sy, sz = scale[0], scale[1], scale[2]
+
+        # Loop-invariant offsets, computed once per call instead of per vertex component.
+        # Negative side: shift positively, then subtract half the scale component.
+        # Positive side: shift negatively, then add half the scale component.
+        shift = 0.5 + scale_multiplier * 0.5
+        dneg = (shift - sx * 0.5, shift - sy * 0.5, shift - sz * 0.5)
+        dpos = (sx * 0.5 - 0.5, sy * 0.5 - 0.5, sz * 0.5 - 0.5)
+
+        for i, v in enumerate(src_vertices):
+            p = [v[0], v[1], v[2]]
+            negs = 0
+            for j in (0, 1, 2):
+                c = p[j]
+                # Both arms are plain offsets, so select them with 0/1 masks instead of branching.
+                # `pos` only holds when `neg` doesn't, matching the original if/elif.
+                neg = c <= -limit
+                pos = (c >= limit) > neg
+                p[j] = c + neg * dneg[j] + pos * dpos[j]
+                negs += neg
+
+            # Adjust UV U-coordinate if UVs exist: shifted once per negative-side component,
+            # applied in a single write per vertex
+            if negs and uvs:
+                uv = uvs[i]
+                uvs[i] = Vec2(uv[0] + negs * shift, uv[1])
+
+            # Normalize the adjusted vertex by dividing by the scale vector
+            verts.append(Vec3(p[0] / sx, p[1] / sy, p[2] / sz))
+
+        # Assign the adjusted vertices and uvs back to the mesh
+        mesh.vertices = verts
+        mesh.uvs = uvs
+
+        # Debug output of the final vertex positions; the guard skips formatting every Vec3 when DEBUG is off
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("stretched vertices: %s", mesh.vertices)
+
+        # Optionally regenerate the mesh to upload changes to GPU
+        if regenerate:
+            mesh.generate()
     except Exception as e:
-        raise RuntimeError(f"Failed to copy mesh.vertices into Vec3 list: {e}") from e
+        raise RuntimeError(f"Failed to stretch mesh: {e}") from e
+
+
+def _base_arrays(mesh):
+    """
+    Returns the unstretched vertices and uvs of `mesh` as tuples of float tuples.
+
+    The arrays are built on first use and cached on the mesh itself, so every regenerate of every
+    SlicedCube sharing that base mesh copies plain floats instead of re-reading the Mesh's Vec3/Vec2 lists.
+
+    Args:
+        mesh (Mesh): The base mesh to read. Its vertices and uvs are assumed not to change afterwards.
+
+    Returns:
+        tuple: (vertices, uvs), each a tuple of float tuples.
+    """
+    cached = getattr(mesh, '_base_arrays', None)
+    if cached is None:
+        cached = (
+            tuple((v[0], v[1], v[2]) for v in mesh.vertices),
+            tuple((uv[0], uv[1]) for uv in mesh.uvs),
+        )
+        mesh._base_arrays = cached
+    return cached
+
+
+def _base_masks(mesh, limit=0.25):
+    """
+    Returns, per vertex of `mesh`, which components lie on the negative or positive side of `limit`.
+
+    Which side a base vertex falls on depends only on the base geometry, not on the scale, so the
+    comparisons stretch_model makes on every call are done once per base mesh and limit and cached
+    on the mesh.
+
+    Args:
+        mesh (Mesh): The base mesh, as passed to _base_arrays.
+        limit (float, optional): Same threshold as stretch_model's `limit`. Defaults to 0.25.
 
-    # Copy original UVs into Vec2 list if UVs exist
+    Returns:
+        tuple: One (nx, ny, nz, px, py, pz, negs) tuple of 0/1 masks per vertex, where `negs` counts
+               the negative-side components. A component is never on both sides.
+    """
+    cache = getattr(mesh, '_base_masks', None)
+    if cache is None:
+        cache = mesh._base_masks = {}
+    masks = cache.get(limit)
+    if masks is None:
+        rows = []
+        for v in _base_arrays(mesh)[0]:
+            nx, ny, nz = int(v[0] <= -limit), int(v[1] <= -limit), int(v[2] <= -limit)
+            rows.append((nx, ny, nz,
+                         int(v[0] >= limit and not nx), int(v[1] >= limit and not ny), int(v[2] >= limit and not nz),
+                         nx + ny + nz))
+        masks = cache[limit] = tuple(rows)
+    return masks
+
+
+def _stretch_base(mesh, scale, scale_multiplier=1, limit=0.25):
+    """
+    Stretch the base arrays of `mesh` for `scale`, specialized for a fixed base mesh.
+
+    Produces the same vertices and uvs as stretch_model(..., src_vertices=..., src_uvs=...), but with the
+    per-vertex side masks taken from _base_masks, so each vertex is a straight-line multiply-add and
+    divide per axis with no comparisons.
+
+    Args:
+        mesh (Mesh): The unmodified base mesh.
+        scale (Vec3): The scale vector (x, y, z). Must be non-zero in every component.
+        scale_multiplier (float, optional): Multiplier applied when shifting vertices. Defaults to 1.
+        limit (float, optional): Threshold passed to _base_masks. Defaults to 0.25.
+
+    Returns:
+        tuple: (vertices, uvs) lists for the stretched mesh.
+    """
+    base_verts, base_uvs = _base_arrays(mesh)
+    masks = _base_masks(mesh, limit)
+
+    sx, sy, sz = scale[0], scale[1], scale[2]
+    shift = 0.5 + scale_multiplier * 0.5
+    dnx, dny, dnz = shift - sx * 0.5, shift - sy * 0.5, shift - sz * 0.5
+    dpx, dpy, dpz = sx * 0.5 - 0.5, sy * 0.5 - 0.5, sz * 0.5 - 0.5
+
+    verts = [
+        Vec3((x + nx * dnx + px * dpx) / sx, (y + ny * dny + py * dpy) / sy, (z + nz * dnz + pz * dpz) / sz)
+        for (x, y, z), (nx, ny, nz, px, py, pz, _) in zip(base_verts, masks)
+    ]
+    uvs = list(base_uvs)
+    for i, m in enumerate(masks):
+        negs = m[6]
+        if negs and i < len(uvs):
+            u, v = uvs[i]
+            uvs[i] = Vec2(u + negs * shift, v)
+    return verts, uvs
+
+
+def _rewrite_vertices_and_uvs(mesh):
+    """
+    Overwrite the positions and uvs of an already generated Mesh in place from `mesh.vertices` and
+    `mesh.uvs`, without rebuilding its GPU data.
+
+    Only possible when the mesh holds a single Geom with one row per vertex. Positions are array 0 of
+    ursina's generated vertex format; the uv array follows the optional color array. Both are float32.
+
+    Args:
+        mesh (Mesh): A Mesh that has been generated before and whose vertices/uvs were just replaced.
+
+    Returns:
+        bool: True if the data was written in place; False if the caller must call mesh.generate().
+    """
+    geom_node = getattr(mesh, 'geomNode', None)
+    if geom_node is None or geom_node.getNumGeoms() != 1:
+        return False
+    vdata = geom_node.modifyGeom(0).modifyVertexData()
+    vertices, uvs = mesh.vertices, mesh.uvs
+    if vdata.getNumRows() != len(vertices) or vdata.getNumArrays() < 2:
+        return False
+    uv_index = 2 if mesh.colors else 1
+    if not uvs or len(uvs) != len(vertices) or vdata.getNumArrays() <= uv_index:
+        return False
+    memoryview(vdata.modify_array(0)).cast('B').cast('f')[:] = array('f', [c for v in vertices for c in v])
+    memoryview(vdata.modify_array(uv_index)).cast('B').cast('f')[:] = array('f', [c for uv in uvs for c in uv])
+    mesh._generated_vertices = None
+    return True
+
+
+# Number of stretched (vertices, uvs) results kept per base mesh, see SlicedCube.generate
+STRETCH_CACHE_SIZE = 256
+
+
+# Base meshes by model name, loaded on first use by _get_base_mesh and shared by every SlicedCube
+_BASE_MESHES = {}
+
+
+def _ensure_sliceable_cube_asset():
+    """
+    Makes sure the pre-generated sliceable_cube.ursinamesh exists next to this file, converting it
+    from sliceable_cube.blend (and saving the result) if it is missing.
+
+    Failures are logged rather than raised; load_model will then report the missing model.
+    """
     try:
-        mesh.uvs = [Vec2(*e) for e in mesh.uvs]
-    except Exception as e:
-        raise RuntimeError(f"Failed to copy mesh.uvs into Vec2 list: {e}") from e
+        # Path of the current file's directory
+        asset_path = Path(__file__).parent
+    except NameError:
+        # In some contexts, __file__ may not exist
+        asset_path = Path(".")
 
-    # Iterate over each vertex and adjust based on limit and scale
     try:
-        for i, v in enumerate(verts):
-            for j in [0, 1, 2]:
-                # v[j] accesses x, y, or z component dynamically
-                if v[j] <= -limit:
-                    # Shift vertex positively, then subtract half the scale component
-                    verts[i][j] += 0.5 + (scale_multiplier / 2)
-                    verts[i][j] -= scale[j] / 2
-                    # Adjust UV U-coordinate if UVs exist
-                    if mesh.uvs:
-                        mesh.uvs[i][0] += 0.5 + (scale_multiplier / 2)
-
-                elif v[j] >= limit:
-                    # Shift vertex negatively, then add half the scale component
-                    verts[i][j] -= 0.5
-                    verts[i][j] += scale[j] / 2
+        # Full path (relative or absolute) to the mesh
+        cube_path = asset_path / 'sliceable_cube.ursinamesh'
+        blend_path = asset_path / 'sliceable_cube.blend'
 
-            # Normalize the adjusted vertex by dividing by the scale vector
-            verts[i] /= scale
-    except Exception as e:
-        raise RuntimeError(f"Error while adjusting vertex positions: {e}") from e
+        # If not found, try loading from blend and save .ursinamesh
+        if not cube_path.exists():
+            loaded = load_model(str(blend_path))
+            if loaded:
+                loaded.save(str(cube_path))
 
-    # Assign the adjusted vertices back to the mesh
-    try:
-        mesh.vertices = verts
     except Exception as e:
-        raise RuntimeError(f"Failed to assign adjusted vertices to mesh: {e}") from e
+        log.warning("[stretch_model] Failed to load or save sliceable_cube models: %s", e)
 
-    # Debug print to inspect the final vertex positions
-    print("----", mesh.vertices)
 
-    # Optionally regenerate the mesh to upload changes to GPU
-    if regenerate:
-        try:
-            mesh.generate()
-        except Exception as e:
-            raise RuntimeError(f"Failed to regenerate mesh after stretching: {e}") from e
-
-
-# Attempt to load a pre-generated sliceable cube; if missing, load from .blend and save as .ursinamesh
-try:
-    # Path of the current file's directory
-    asset_path = Path(__file__).parent
-except NameError:
-    # In some contexts, __file__ may not exist
-    asset_path = Path(".")
-
-try:
-    # Full path (relative or absolute) to the mesh
-    cube_path = asset_path / 'sliceable_cube.ursinamesh'
-    blend_path = asset_path / 'sliceable_cube.blend'
-
-    # Try loading the .ursinamesh file
-    if cube_path.exists():
-        loaded = load_model(str(cube_path))
-    else:
-        # If not found, try loading from blend and save .ursinamesh
-        loaded = load_model(str(blend_path))
-        if loaded:
-            loaded.save(str(cube_path))
+def _get_base_mesh(name):
+    """
+    Returns the base mesh for the model `name`, loading it on first use.
 
-except Exception as e:
-    print(f"[stretch_model] Warning: Failed to load or save sliceable_cube models: {e}")
+    Nothing is loaded at import time, so importing this module is cheap and costs nothing if no
+    SlicedCube is ever created. The mesh is loaded as a private deep copy (the global asset is never
+    touched) and then shared by all cubes, which only ever read it.
+
+    Args:
+        name (str): Model name passed to `load_model`, e.g. 'sliceable_cube'.
+
+    Returns:
+        Mesh | None: The cached base mesh, or None if the model could not be loaded.
+    """
+    mesh = _BASE_MESHES.get(name)
+    if mesh is None:
+        if name == 'sliceable_cube':
+            _ensure_sliceable_cube_asset()
+        mesh = load_model(name, use_deepcopy=True)
+        if mesh:
+            _BASE_MESHES[name] = mesh
+            log.debug("Loaded stretchable mesh: %s", mesh)
+    return mesh
 
 
 @generate_properties_for_class()
@@ -125,8 +297,9 @@ class SlicedCube(Entity):
     Editor-friendly Entity that displays a cube whose mesh is dynamically 'stretched'
     whenever the entity's scale changes.
 
-    The cube's base mesh (sliceable_cube) is loaded once. On initialization, a deep copy
-    of that mesh is assigned to self.model. Whenever the entity's scale or transform
+    The cube's base mesh (sliceable_cube) is loaded once, on first use, and shared by all cubes.
+    On initialization, a Mesh with its own copy of the base vertices and uvs (sharing the base
+    triangles and normals) is assigned to self.model. Whenever the entity's scale or transform
     changes, the mesh is re-stretched so that its UVs and vertices update accordingly,
     preventing texture stretching artifacts.
 
@@ -139,6 +312,10 @@ class SlicedCube(Entity):
             - name (str): Entity name (default 'sliced_cube').
             - scale_multiplier (float): Factor to multiply when stretching UVs.
         stretchable_mesh (Mesh): The original Mesh to be used as a base for stretching.
+        _dirty (bool): True while a scale/transform change has not been stretched into the mesh yet.
+        _flush_scheduled (bool): True while a deferred `_flush_generate` is pending.
+        _suspend (int): Nesting depth of `batch_update()` blocks; no regeneration runs while above 0.
+        _last_stretched_scale (tuple | None): (world_scale x, y, z, scale_multiplier) the model was last stretched for.
         scale_multiplier (float): Multiplier applied during mesh stretching.
         scale (Vec3): The entity's scale (inherited from Entity).
         texture (str): Texture name applied to this entity's model.
@@ -159,7 +336,7 @@ class SlicedCube(Entity):
 
         Args:
             stretchable_mesh (str | Mesh): 
-                - If a string, `load_model` is called to retrieve a Mesh by that name.
+                - If a string, the shared base Mesh of that name is used, loaded with `load_model` on first use.
                 - If already a Mesh, it's used directly.
             **kwargs: Additional properties to override default_values, including:
                 - scale_multiplier (float): Factor used when stretching UVs.
@@ -173,19 +350,16 @@ class SlicedCube(Entity):
             KeyError: If required keys (e.g., 'scale_multiplier', 'scale', 'texture') are missing.
         """
         # Merge provided kwargs with default_values
-        try:
-            config = __class__.default_values | kwargs
-        except Exception as e:
-            raise RuntimeError(f"Failed to merge default properties: {e}") from e
+        config = __class__.default_values | kwargs
 
         # Determine the base mesh to use for stretching
         if isinstance(stretchable_mesh, str):
             try:
-                # Load the mesh by name; use a deepcopy to avoid modifying the global asset
-                stretchable_mesh = load_model(stretchable_mesh, use_deepcopy=True)
-                if not stretchable_mesh:
+                # Look up the shared base mesh by name, loading it on first use
+                mesh = _get_base_mesh(stretchable_mesh)
+                if not mesh:
                     raise RuntimeError(f"load_model returned None for '{stretchable_mesh}'")
-                print("Loaded stretchable mesh:", stretchable_mesh)
+                stretchable_mesh = mesh
             except Exception as e:
                 pass
                 # raise RuntimeError(f"Failed to load mesh '{stretchable_mesh}': {e}") from e
@@ -193,94 +367,157 @@ class SlicedCube(Entity):
             # If not a string, expect a Mesh-like object with 'vertices' attribute
             raise TypeError("stretchable_mesh must be a string model name or a Mesh instance.")
 
-        # Store the base mesh; will be deep-copied for this instance's model
+        # Store the base mesh; its vertices and uvs are copied into this instance's model
         self.stretchable_mesh = stretchable_mesh
 
-        # Call base Entity constructor with merged configuration
+        # Scale/transform writes are coalesced through these flags (see __setattr__/_flush_generate)
+        self._dirty = False
+        self._flush_scheduled = False
+        self._suspend = 0
+        self._last_stretched_scale = None
+
         try:
+            # Call base Entity constructor with merged configuration
             super().__init__(**config)
-        except Exception as e:
-            raise RuntimeError(f"Failed to initialize base Entity: {e}") from e
 
-        # Assign a deep copy of the stretchable mesh to this entity's model
-        try:
-            self.model = deepcopy(self.stretchable_mesh)
+            # Give this entity its own copy of the vertices and uvs, the only arrays stretch_model rewrites.
+            # Triangles, colors and normals are never mutated, so they are shared with the base mesh.
+            base = self.stretchable_mesh
+            base_verts, base_uvs = _base_arrays(base)
+            self.model = Mesh(
+                vertices=list(base_verts),
+                triangles=base.triangles,
+                colors=base.colors,
+                uvs=list(base_uvs),
+                normals=base.normals,
+                static=False,  # rewritten in place on every stretch
+                mode=base.mode,
+            )
             self.model.name = 'cube'
-        except Exception as e:
-            raise RuntimeError(f"Failed to deepcopy stretchable_mesh for model: {e}") from e
 
-        # Assign runtime properties from config
-        try:
+            # Assign runtime properties from config
             self.scale_multiplier = config['scale_multiplier']
             self.scale = config['scale']
             self.texture = config['texture']
         except KeyError as e:
             raise KeyError(f"Missing required property '{e.args[0]}' in kwargs.") from e
         except Exception as e:
-            raise RuntimeError(f"Failed to assign runtime properties: {e}") from e
+            raise RuntimeError(f"Failed to initialize SlicedCube: {e}") from e
+
+        # Stretch now rather than on the deferred flush, so a new (or duplicated) cube never shows
+        # or reports unstretched geometry
+        self._flush_generate()
 
     def __deepcopy__(self, memo):
         """
-        Create a deep copy of this SlicedCube by evaluating its repr.
+        Create a deep copy of this SlicedCube by constructing a new one from its current state.
+
+        Like PokeShape, the copy is built from the properties that differ from default_values
+        (`get_changes`), so color, origin, texture_scale, enabled and the transform carry over; it
+        also keeps the parent and shader inputs. The live values are passed instead of get_changes'
+        source-formatted strings, and the copy shares this instance's (never mutated)
+        stretchable_mesh, so no model is loaded from disk.
 
         Returns:
             SlicedCube: A new instance with identical properties.
 
         Raises:
-            RuntimeError: If repr(self) is not evaluable to recreate the object.
+            RuntimeError: If the copy cannot be constructed from this instance's state.
         """
         try:
-            return eval(repr(self))
+            changes = {key: getattr(self, key) for key in self.get_changes(SlicedCube)}
+            # The model is rebuilt from stretchable_mesh, and colliders are recreated from their type
+            changes.pop('model', None)
+            if 'collider' in changes:
+                changes['collider'] = self.collider.name if self.collider else None
+            new = SlicedCube(stretchable_mesh=self.stretchable_mesh, parent=self.parent, **changes)
+            memo[id(self)] = new
+            # Applied again after __init__ swapped in the stretched model
+            new.origin = self.origin
+            new.texture_scale = self.texture_scale
+            for shader_key, shader_val in self._shader_inputs.items():
+                new.set_shader_input(shader_key, shader_val)
+            return new
         except Exception as e:
-            raise RuntimeError("Deepcopy failed: repr(self) could not recreate the object.") from e
+            raise RuntimeError(f"Failed to deep copy SlicedCube: {e}") from e
 
     def generate(self):
         """
         Re-stretches the cube's mesh based on the current world_scale and scale_multiplier.
 
+        Does nothing if world_scale and scale_multiplier are unchanged since the last stretch, which
+        is common when Ursina re-applies a transform internally.
+
         Steps:
-            1. Reset the mesh's vertices and uvs to the original unmodified base mesh.
-            2. Call `stretch_model` to adjust vertices and uvs based on world_scale.
-            3. Call `self.model.generate()` to upload new data to the GPU.
+            1. If this base mesh was already stretched for the same (rounded) world_scale and
+               scale_multiplier, e.g. by another cube of the same size, reuse that result.
+            2. Otherwise stretch the cached arrays of the unmodified base mesh for world_scale (the same
+               result as `stretch_model`, using precomputed side masks), write them into the model
+               in one pass, and remember the result.
+            3. Write the new data into the model's existing GPU vertex buffers, or call
+               `self.model.generate()` if they can't be reused.
 
         Raises:
             RuntimeError: If any step in regeneration fails (e.g., missing attributes).
         """
-        print("update model", self.scale)
+        ws = self.world_scale
+        stretched_scale = (ws[0], ws[1], ws[2], self.scale_multiplier)
+        last = self._last_stretched_scale
+        if last is not None and last[3] == stretched_scale[3] and all(
+                isclose(a, b, rel_tol=1e-6) for a, b in zip(last[:3], stretched_scale[:3])):
+            return
+        log.debug("update model %s", ws)
 
-        # Reset vertices and UVs from the base stretchable_mesh
         try:
-            self.model.vertices = self.stretchable_mesh.vertices
-            self.model.uvs = self.stretchable_mesh.uvs
+            # Look up an earlier stretch of the same base mesh at the same size
+            key = (round(ws[0], 4), round(ws[1], 4), round(ws[2], 4), self.scale_multiplier)
+            cache = getattr(self.stretchable_mesh, '_stretch_cache', None)
+            if cache is None:
+                cache = self.stretchable_mesh._stretch_cache = {}
+            cached = cache.get(key)
+
+            if cached is not None:
+                self.model.vertices = list(cached[0])
+                self.model.uvs = list(cached[1])
+            else:
+                # Stretch straight from the cached base arrays of stretchable_mesh into the model,
+                # using current world_scale and the base mesh's precomputed side masks
+                self.model.vertices, self.model.uvs = _stretch_base(
+                    self.stretchable_mesh, ws, scale_multiplier=self.scale_multiplier)
+
+                # Remember the result, evicting the oldest entry once the cache is full
+                if len(cache) >= STRETCH_CACHE_SIZE:
+                    del cache[next(iter(cache))]
+                cache[key] = (tuple(self.model.vertices), tuple(self.model.uvs))
+
+            # Upload the modified mesh data to the GPU; the topology never changes, so overwrite
+            # the existing vertex buffers in place and only fall back to a full rebuild if that fails
+            if not _rewrite_vertices_and_uvs(self.model):
+                self.model.generate()
         except Exception as e:
-            raise RuntimeError(f"Failed to reset model vertices/uvs from stretchable_mesh: {e}") from e
+            raise RuntimeError(f"Failed to regenerate SlicedCube mesh: {e}") from e
 
-        # Stretch the mesh using current world_scale
-        try:
-            stretch_model(self.model, self.world_scale, scale_multiplier=self.scale_multiplier)
-        except Exception as e:
-            raise RuntimeError(f"Error in stretch_model during generate(): {e}") from e
-
-        # Upload the modified mesh data to the GPU
-        try:
-            self.model.generate()
-        except Exception as e:
-            raise RuntimeError(f"Failed to generate mesh after stretching: {e}") from e
+        self._last_stretched_scale = stretched_scale
 
     def __setattr__(self, name, value):
         """
         Override setattr to regenerate the mesh automatically when certain attributes change.
 
         If `name` is one of 'scale', 'scale_x', 'scale_y', 'scale_z', 'transform', or
-        'world_transform', then after setting the attribute, call `self.generate()` to
-        update the stretched mesh.
+        'world_transform', then after setting the attribute, the mesh is marked dirty and a
+        single deferred `_flush_generate` is scheduled. A burst of writes (e.g. scale_x, scale_y
+        and scale_z in a row) therefore results in only one stretch and upload.
+
+        Until that flush runs (the next frame), `model` still holds the previous geometry. Callers
+        that need the stretched mesh right after changing the scale should call `generate()`
+        directly, or make their changes inside `batch_update()`, which regenerates on exit.
 
         Args:
             name (str): The attribute name to set.
             value: The new value of the attribute.
-        
+
         Raises:
-            RuntimeError: If automatic regeneration fails.
+            RuntimeError: If scheduling the regeneration fails.
         """
         # Always perform the normal attribute assignment first
         super().__setattr__(name, value)
@@ -294,10 +531,56 @@ class SlicedCube(Entity):
             'transform',
             'world_transform',
         ):
+            self._dirty = True
+            if self._suspend or self._flush_scheduled:
+                return
             try:
-                self.generate()
+                # invoke() runs immediately when delay is 0, so wait one frame to let the burst finish
+                invoke(self._flush_generate, delay=1/60)
+                self._flush_scheduled = True
             except Exception as e:
-                raise RuntimeError(f"Automatic regeneration in __setattr__ failed: {e}") from e
+                raise RuntimeError(f"Failed to schedule regeneration in __setattr__: {e}") from e
+
+    def _flush_generate(self):
+        """
+        Run the regeneration scheduled from __setattr__ if the mesh is still dirty, and clear the
+        pending flag so the next change can schedule another one. Does nothing while inside a
+        `batch_update()` block; the block regenerates on exit instead.
+
+        Raises:
+            RuntimeError: If regeneration fails. The mesh stays dirty, so the next flush retries it.
+        """
+        self._flush_scheduled = False
+        if not self._dirty or self._suspend or not self.model:
+            return
+        self._dirty = False
+        try:
+            self.generate()
+        except Exception:
+            self._dirty = True
+            raise
+
+    @contextmanager
+    def batch_update(self):
+        """
+        Context manager that holds back regeneration until the block exits.
+
+        Example:
+            with cube.batch_update():
+                cube.scale_x = 2
+                cube.scale_y = 3
+                cube.world_position = (1, 0, 1)
+
+        Blocks can be nested; the mesh is stretched once when the outermost one exits,
+        and only if a scale/transform attribute was actually written.
+        """
+        self._suspend += 1
+        try:
+            yield self
+        finally:
+            self._suspend -= 1
+            if not self._suspend:
+                self._flush_generate()
 
 
 if __name__ == '__main__':